@@ -1,5 +1,5 @@
 
-import json, os, uuid, datetime, boto3
+import json, os, secrets, datetime, boto3
 s3 = boto3.client('s3')
 BUCKET = os.environ.get('BUCKET', 'vgnshlvnz-job-tracker')
 
@@ -15,7 +15,7 @@ def lambda_handler(event, context):
     # POST /applications
     if method == 'POST' and path == '/applications':
         body = json.loads(event.get('body') or '{}')
-        app_id = f"app_{datetime.date.today()}_{uuid.uuid4().hex[:4]}"
+        app_id = f"app_{datetime.date.today()}_{secrets.token_hex(2)}"
         prefix = _app_prefix(app_id)
         meta = {
             "application_id": app_id,
@@ -3,39 +3,50 @@ Job Tracker Lambda Function
 Handles CRUD operations for job applications stored in S3
 """
 
+import base64
 import json
 import os
-import uuid
+import secrets
 import logging
+import math
 import re
+import threading
 import time
-from datetime import datetime, date
-from typing import Dict, Any, List, Optional, Tuple
+from datetime import datetime, date, timezone
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+from types import MappingProxyType
 from html import escape
-import boto3
-from botocore.exceptions import ClientError
-from botocore.config import Config
-import jwt
-from jwt import PyJWKClient
-from collections import defaultdict
+from botocore.exceptions import BotoCoreError, ClientError, ParamValidationError
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 
 # Configure logging
 logger = logging.getLogger()
 logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO'))
 
-# Import Email notification module (Amazon SES)
+# Fast JSON serialization (falls back to stdlib json if orjson isn't packaged)
 try:
-    from email_ses import send_application_notification as send_email_notification, is_ses_enabled
-    EMAIL_AVAILABLE = True
-except ImportError as e:
-    logger.warning(f"Email SES module not available: {e}")
-    EMAIL_AVAILABLE = False
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Environment variables
 BUCKET_NAME = os.environ.get('BUCKET_NAME', 'vgnshlvnz-job-tracker')
 PRESIGNED_URL_EXPIRY = int(os.environ.get('PRESIGNED_URL_EXPIRY', '900'))
 REGION = os.environ.get('REGION', 'ap-southeast-5')
 
+# Indent API response bodies (debugging only; compact JSON is smaller and faster)
+PRETTY_JSON = os.environ.get('PRETTY_JSON', 'false').lower() == 'true'
+
+# Concurrent meta.json GETs when listing without the index (threads share the S3 client pool)
+LIST_MAX_WORKERS = int(os.environ.get('LIST_MAX_WORKERS', '32'))
+
+# Optional DynamoDB index (EnableDynamoDB parameter in template-job-tracker.yaml)
+DYNAMODB_TABLE = os.environ.get('DYNAMODB_TABLE', '')
+USE_DYNAMODB = os.environ.get('USE_DYNAMODB', 'false').lower() == 'true' and bool(DYNAMODB_TABLE)
+
 # Cognito configuration for JWT validation
 USER_POOL_ID = os.environ.get('USER_POOL_ID', 'ap-southeast-5_0QQg8Wd6r')
 CLIENT_ID = os.environ.get('CLIENT_ID', '4f8f3qon7v6tegud4qe854epo6')
@@ -45,27 +56,191 @@ COGNITO_ISSUER = f'https://cognito-idp.{REGION}.amazonaws.com/{USER_POOL_ID}'
 DOWNLOAD_URL_EXPIRY = 300  # 5 minutes
 UPLOAD_URL_EXPIRY = 600    # 10 minutes
 
-# Allowed origins for CORS
-ALLOWED_ORIGINS = [
-    'https://cv.vgnshlv.nz',
+# Allowed origins for CORS (set for O(1) lookups; unknown origins get the default)
+DEFAULT_ORIGIN = 'https://cv.vgnshlv.nz'
+ALLOWED_ORIGINS = frozenset({
+    DEFAULT_ORIGIN,
     'https://d1cda43lowke66.cloudfront.net'
-]
+})
+
+# meta.json cache for warm containers: key -> (ETag, parsed meta), LRU ordered.
+# Shared by the list fan-out threads, hence the lock
+_meta_cache: "OrderedDict[str, Tuple[str, Dict]]" = OrderedDict()
+_meta_cache_lock = threading.Lock()
+
+# AWS clients (created on first use so boto3 is only imported by requests
+# that touch AWS; OPTIONS preflights never pay for it)
+s3 = None
+dynamodb = None
+lambda_client = None
+
+# Email notification module (Amazon SES), imported on first use: it imports
+# boto3 and builds an SES client, which only submission endpoints need
+email_ses = None
+
+
+def _s3():
+    """Get the shared S3 client, creating it on first use"""
+    global s3
+    if s3 is None:
+        import boto3
+        from botocore.config import Config
+        s3 = boto3.client(
+            's3',
+            region_name=REGION,
+            config=Config(
+                signature_version='s3v4',
+                s3={'addressing_style': 'virtual'},
+                tcp_keepalive=True,  # Keep pooled connections alive across warm invocations
+                max_pool_connections=max(64, LIST_MAX_WORKERS),  # Room for the concurrent meta.json fan-out
+                retries={'max_attempts': 3, 'mode': 'standard'}
+            )
+        )
+    return s3
+
+
+def _dynamodb():
+    """Get the shared DynamoDB client for the index table, creating it on first use"""
+    global dynamodb
+    if dynamodb is None:
+        import boto3
+        dynamodb = boto3.client('dynamodb', region_name=REGION)
+    return dynamodb
+
+
+def _lambda():
+    """Get the shared Lambda client (async self-invocation), creating it on first use"""
+    global lambda_client
+    if lambda_client is None:
+        import boto3
+        lambda_client = boto3.client('lambda', region_name=REGION)
+    return lambda_client
+
+
+def _email_ses():
+    """Get the email_ses module, importing it on first use (None if it isn't packaged)"""
+    global email_ses
+    if email_ses is None:
+        try:
+            import email_ses as module
+            email_ses = module
+        except ImportError as e:
+            logger.warning("Email SES module not available: %s", e)
+            email_ses = False
+    return email_ses or None
 
-# AWS clients
-s3 = boto3.client(
-    's3',
-    region_name=REGION,
-    config=Config(
-        signature_version='s3v4',
-        s3={'addressing_style': 'virtual'}
-    )
-)
 
 # Constants
-ALLOWED_CV_TYPES = ['application/pdf', 'application/vnd.openxmlformats-officedocument.wordprocessingml.document']
-ALLOWED_JD_TYPES = ['application/pdf', 'application/vnd.openxmlformats-officedocument.wordprocessingml.document']
+ALLOWED_CV_TYPES = frozenset({'application/pdf', 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'})
+ALLOWED_JD_TYPES = frozenset({'application/pdf', 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'})
 MAX_CV_SIZE = 10 * 1024 * 1024  # 10MB
 MAX_JD_SIZE = 5 * 1024 * 1024   # 5MB
+DELETE_BATCH_SIZE = 1000  # S3 DeleteObjects per-request key limit
+DELETE_MAX_WORKERS = 4  # Concurrent DeleteObjects calls while listing continues
+META_UPDATE_ATTEMPTS = 3  # Conditional meta.json writes retried when a concurrent update wins
+WRITE_CONFLICT_CODES = frozenset({'PreconditionFailed', 'ConditionalRequestConflict'})
+MAX_BODY_BYTES = 256 * 1024  # Largest accepted JSON request body (decoded)
+META_CACHE_SIZE = 1024  # meta.json documents kept per warm container (LRU)
+
+# meta.json schema defaults for new applications (read-only; lists are tuples
+# so nothing mutable is shared between requests, and serialize as JSON arrays)
+_APPLICATION_DEFAULTS = MappingProxyType({
+    "status": "applied",
+    "job_title": "",
+    "agency_name": "",
+    "company_name": "",
+    "caller": MappingProxyType({"name": "", "email": "", "phone": ""}),
+    "caller_method": "",
+    "salary": MappingProxyType({"currency": "MYR", "min": 0, "max": 0, "period": "monthly"}),
+    "perks": (),
+    "details": MappingProxyType({
+        "roles": "",
+        "responsibilities": (),
+        "skillsets": (),
+        "questions_asked": (),
+        "info_provided": ()
+    }),
+    "tags": ()
+})
+
+
+def _json_dumps(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes (compact unless pretty)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else None)
+    if pretty:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _json_loads(data: Any) -> Any:
+    """Parse JSON from bytes or str (S3 bodies are parsed without decoding first)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _with_defaults(defaults: Mapping, values: Dict) -> Dict:
+    """Schema-shaped copy of defaults, taking known keys from values (nested sections merged too)"""
+    merged = {}
+    for key, default in defaults.items():
+        if isinstance(default, Mapping):
+            merged[key] = _with_defaults(default, values.get(key) or {})
+        else:
+            merged[key] = values.get(key, default)
+    return merged
+
+
+def _body_too_large(event: Dict) -> bool:
+    """Whether the request body exceeds MAX_BODY_BYTES (checked before any parsing)"""
+    body = event.get('body') or ''
+    if event.get('isBase64Encoded'):
+        return len(body) * 3 // 4 > MAX_BODY_BYTES  # Base64 expands 3 bytes to 4
+    return len(body) > MAX_BODY_BYTES
+
+
+def _parse_body(event: Dict) -> Dict:
+    """Parse the JSON object request body; raises json.JSONDecodeError if invalid"""
+    body = event.get('body') or '{}'
+    if event.get('isBase64Encoded'):
+        try:
+            body = base64.b64decode(body)
+        except ValueError as e:  # binascii.Error, or non-ASCII input
+            raise json.JSONDecodeError(f"Invalid base64 body: {e}", str(body)[:100], 0)
+
+    parsed = _json_loads(body)
+    if not isinstance(parsed, dict):
+        raise json.JSONDecodeError("Expected a JSON object", str(body)[:100], 0)
+    return parsed
+
+
+def _presign_put(key: str, expires_in: int, content_type: str = "application/pdf") -> str:
+    """Presigned PUT URL; Content-Type stays signed so uploads must match it"""
+    return _s3().generate_presigned_url(
+        ClientMethod='put_object',
+        Params={"Bucket": BUCKET_NAME, "Key": key, "ContentType": content_type},
+        ExpiresIn=expires_in
+    )
+
+
+def _presign_get(key: str, expires_in: int) -> str:
+    """Presigned GET URL for downloading an object"""
+    return _s3().generate_presigned_url(
+        ClientMethod='get_object',
+        Params={"Bucket": BUCKET_NAME, "Key": key},
+        ExpiresIn=expires_in
+    )
+
+
+@lru_cache(maxsize=4096)
+def _id_prefix(item_id: str, folder: str) -> str:
+    """
+    Get S3 prefix for an ID folder (memoized; invalid IDs raise and are not cached)
+    IDs are fixed-width <xxx>_YYYY-MM-DD_<hex>, so the year is a plain slice
+    """
+    if len(item_id) < 19 or item_id[3] != '_' or item_id[8] != '-' or not item_id[4:8].isdigit():
+        raise ValueError(item_id)
+    return f"{folder}/{item_id[4:8]}/{item_id}/"
 
 
 def _app_prefix(app_id: str) -> str:
@@ -74,25 +249,22 @@ def _app_prefix(app_id: str) -> str:
     app_2025-11-01_abc123 -> applications/2025/app_2025-11-01_abc123/
     """
     try:
-        # Extract year from app_id: app_YYYY-MM-DD_uuid
-        date_part = app_id.split('_')[1]  # "2025-11-01"
-        year = date_part.split('-')[0]     # "2025"
-        return f"applications/{year}/{app_id}/"
-    except (IndexError, ValueError) as e:
-        logger.error(f"Invalid app_id format: {app_id}")
+        return _id_prefix(app_id, "applications")
+    except ValueError:
+        logger.error("Invalid app_id format: %s", app_id)
         raise ValueError(f"Invalid application ID format: {app_id}")
 
 
-def _generate_app_id() -> str:
-    """Generate unique application ID: app_YYYY-MM-DD_UUID"""
-    today = date.today().isoformat()  # "2025-11-01"
-    unique_id = uuid.uuid4().hex[:8]  # 8 characters
+def _generate_app_id(today: Optional[str] = None) -> str:
+    """Generate unique application ID: app_YYYY-MM-DD_UUID (today defaults to the current date)"""
+    today = today or date.today().isoformat()  # "2025-11-01"
+    unique_id = secrets.token_hex(8)  # 16 hex characters
     return f"app_{today}_{unique_id}"
 
 
 def _utc_now() -> str:
     """Get current UTC timestamp in ISO format"""
-    return datetime.utcnow().isoformat() + "Z"
+    return datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
 
 
 def _rec_prefix(rec_id: str) -> str:
@@ -101,32 +273,46 @@ def _rec_prefix(rec_id: str) -> str:
     rec_2025-11-01_abc123 -> recruiters/2025/rec_2025-11-01_abc123/
     """
     try:
-        # Extract year from rec_id: rec_YYYY-MM-DD_uuid
-        date_part = rec_id.split('_')[1]  # "2025-11-01"
-        year = date_part.split('-')[0]     # "2025"
-        return f"recruiters/{year}/{rec_id}/"
-    except (IndexError, ValueError) as e:
-        logger.error(f"Invalid rec_id format: {rec_id}")
+        return _id_prefix(rec_id, "recruiters")
+    except ValueError:
+        logger.error("Invalid rec_id format: %s", rec_id)
         raise ValueError(f"Invalid submission ID format: {rec_id}")
 
 
-def _generate_rec_id() -> str:
-    """Generate unique recruiter submission ID: rec_YYYY-MM-DD_UUID"""
-    today = date.today().isoformat()  # "2025-11-01"
-    unique_id = uuid.uuid4().hex[:8]  # 8 characters
+def _generate_rec_id(today: Optional[str] = None) -> str:
+    """Generate unique recruiter submission ID: rec_YYYY-MM-DD_UUID (today defaults to the current date)"""
+    today = today or date.today().isoformat()  # "2025-11-01"
+    unique_id = secrets.token_hex(8)  # 16 hex characters
     return f"rec_{today}_{unique_id}"
 
 
 # ========== SECURITY FUNCTIONS ==========
 
 # In-memory rate limiter (use DynamoDB for production with multiple Lambda instances)
-rate_limit_store = defaultdict(list)
+rate_limit_store = defaultdict(deque)
+RATE_LIMIT_MAX_TRACKED_IPS = 10000  # Prune idle IPs beyond this many entries
+
+
+@lru_cache(maxsize=1)
+def _jwks_client(issuer: str) -> Any:
+    """Shared JWKS client for the Cognito issuer, so its key cache survives warm invocations"""
+    from jwt import PyJWKClient
+    return PyJWKClient(
+        f"{issuer}/.well-known/jwks.json",
+        cache_keys=True,
+        max_cached_keys=16,
+        lifespan=3600  # Re-fetch the key set hourly to pick up rotations
+    )
+
 
 def validate_token(event: Dict) -> Optional[Dict]:
     """
     Validate Cognito JWT token from Authorization header
     Returns decoded token payload if valid, raises exception otherwise
     """
+    # Imported here so public requests and preflights skip PyJWT/cryptography
+    import jwt
+
     try:
         # Get Authorization header
         headers = event.get('headers', {})
@@ -140,12 +326,8 @@ def validate_token(event: Dict) -> Optional[Dict]:
 
         token = auth_header.split(' ')[1]
 
-        # Get Cognito public keys
-        jwks_url = f"{COGNITO_ISSUER}/.well-known/jwks.json"
-        jwks_client = PyJWKClient(jwks_url, cache_keys=True)
-
-        # Get signing key from token
-        signing_key = jwks_client.get_signing_key_from_jwt(token)
+        # Get signing key from token (Cognito public keys are cached per container)
+        signing_key = _jwks_client(COGNITO_ISSUER).get_signing_key_from_jwt(token)
 
         # Decode and validate token
         decoded = jwt.decode(
@@ -157,7 +339,7 @@ def validate_token(event: Dict) -> Optional[Dict]:
             options={"verify_exp": True}
         )
 
-        logger.info(f"Token validated for user: {decoded.get('email', decoded.get('sub'))}")
+        logger.info("Token validated for user: %s", decoded.get('email', decoded.get('sub')))
         return decoded
 
     except jwt.ExpiredSignatureError:
@@ -169,7 +351,7 @@ def validate_token(event: Dict) -> Optional[Dict]:
     except jwt.DecodeError:
         raise ValueError("Invalid token format")
     except Exception as e:
-        logger.error(f"Token validation error: {str(e)}")
+        logger.error("Token validation error: %s", e)
         raise ValueError(f"Token validation failed: {str(e)}")
 
 
@@ -183,51 +365,61 @@ def is_admin(user: Dict) -> bool:
 def check_rate_limit(ip: str, limit: int = 5, window: int = 300) -> Tuple[bool, str]:
     """
     Check if IP exceeds rate limit
-    limit: max requests per window
+    limit: max timestamps per window
     window: time window in seconds (default: 5 minutes)
     """
-    now = time.time()
+    now = time.monotonic()
     cutoff = now - window
 
-    # Clean old requests
-    rate_limit_store[ip] = [t for t in rate_limit_store[ip] if t > cutoff]
+    # Drop expired requests (timestamps are appended in order, oldest on the left)
+    timestamps = rate_limit_store[ip]
+    while timestamps and timestamps[0] <= cutoff:
+        timestamps.popleft()
 
     # Check limit
-    if len(rate_limit_store[ip]) >= limit:
-        retry_after = int(cutoff + window - now)
+    if len(timestamps) >= limit:
+        retry_after = math.ceil(timestamps[0] - cutoff)
         return False, f"Rate limit exceeded. Try again in {retry_after} seconds"
 
     # Add current request
-    rate_limit_store[ip].append(now)
+    timestamps.append(now)
+
+    # Bound memory on long-lived containers by forgetting idle IPs
+    if len(rate_limit_store) > RATE_LIMIT_MAX_TRACKED_IPS:
+        for stale_ip in [k for k, v in rate_limit_store.items() if not v or v[-1] <= cutoff]:
+            del rate_limit_store[stale_ip]
+
     return True, ""
 
 
+# "email"/"phone" string fields anywhere in a JSON body (handles escaped quotes)
+EMAIL_FIELD_PATTERN = re.compile(r'("email"\s*:\s*)"(?:[^"\\]|\\.)*"')
+PHONE_FIELD_PATTERN = re.compile(r'("phone"\s*:\s*)"(?:[^"\\]|\\.)*"')
+
+
 def sanitize_event_for_logging(event: Dict) -> Dict:
     """Remove sensitive data from event before logging"""
     safe_event = event.copy()
 
     # Remove headers with sensitive data
-    if 'headers' in safe_event:
+    if safe_event.get('headers'):
         safe_headers = {}
         for key, value in safe_event['headers'].items():
-            if key.lower() in ['authorization', 'cookie', 'x-api-key']:
+            if key.lower() in ('authorization', 'cookie', 'x-api-key'):
                 safe_headers[key] = '***REDACTED***'
             else:
                 safe_headers[key] = value
         safe_event['headers'] = safe_headers
 
-    # Redact PII from body
+    # Redact PII from body with a regex pass over the raw JSON (no parse and
+    # re-serialize); anything that isn't a plain JSON object is dropped
     if 'body' in safe_event and safe_event['body']:
-        try:
-            body = json.loads(safe_event['body'])
-            if 'recruiter' in body:
-                if 'email' in body['recruiter']:
-                    body['recruiter']['email'] = '***@***.***'
-                if 'phone' in body['recruiter']:
-                    body['recruiter']['phone'] = '+**-**-***'
-            safe_event['body'] = json.dumps(body)
-        except:
+        body = safe_event['body']
+        if safe_event.get('isBase64Encoded') or not body.lstrip().startswith('{'):
             safe_event['body'] = '***REDACTED***'
+        else:
+            body = EMAIL_FIELD_PATTERN.sub(r'\1"***@***.***"', body)
+            safe_event['body'] = PHONE_FIELD_PATTERN.sub(r'\1"+**-**-***"', body)
 
     return safe_event
 
@@ -243,13 +435,24 @@ def sanitize_submission_for_recruiter(meta: Dict) -> Dict:
 
 # ========== INPUT VALIDATION FUNCTIONS ==========
 
+# Compiled once at import instead of looked up in the re cache on every call
+EMAIL_PATTERN = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+PHONE_PATTERN = re.compile(r'[\d\s\+\-\(\)]+')  # Digits, +, -, (, ), spaces
+CONTROL_CHARS_PATTERN = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')  # Control chars except \t, \n, \r
+
+
+@lru_cache(maxsize=8)
+def _id_pattern(prefix: str) -> re.Pattern:
+    """Compiled ID pattern for a prefix: <prefix>_YYYY-MM-DD_<16 hex> (legacy IDs have 8)"""
+    return re.compile(rf'{re.escape(prefix)}_\d{{4}}-\d{{2}}-\d{{2}}_[a-f0-9]{{8}}(?:[a-f0-9]{{8}})?')
+
+
 def validate_email(email: str) -> Tuple[bool, str]:
     """Validate email format"""
     if not email or len(email) > 254:
         return False, "Invalid email length"
 
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    if not re.match(pattern, email):
+    if not EMAIL_PATTERN.fullmatch(email):
         return False, "Invalid email format"
 
     return True, ""
@@ -260,9 +463,7 @@ def validate_phone(phone: str) -> Tuple[bool, str]:
     if not phone or len(phone) > 20:
         return False, "Invalid phone length"
 
-    # Allow only digits, +, -, (, ), spaces
-    pattern = r'^[\d\s\+\-\(\)]+$'
-    if not re.match(pattern, phone):
+    if not PHONE_PATTERN.fullmatch(phone):
         return False, "Invalid phone format"
 
     return True, ""
@@ -279,7 +480,7 @@ def validate_string(value: str, max_length: int, field_name: str, required: bool
         return False, f"{field_name} exceeds {max_length} characters"
 
     # Check for null bytes and control characters
-    if '\x00' in value or any(ord(c) < 32 and c not in '\t\n\r' for c in value):
+    if CONTROL_CHARS_PATTERN.search(value):
         return False, f"{field_name} contains invalid characters"
 
     return True, ""
@@ -287,15 +488,34 @@ def validate_string(value: str, max_length: int, field_name: str, required: bool
 
 def validate_id_format(id_value: str, prefix: str) -> bool:
     """Validate ID format to prevent path traversal"""
-    pattern = f'^{prefix}_\\d{{4}}-\\d{{2}}-\\d{{2}}_[a-f0-9]{{8}}$'
-    return bool(re.match(pattern, id_value))
+    return bool(_id_pattern(prefix).fullmatch(id_value))
+
+
+# Recruiter submission statuses (message keeps the workflow order)
+SUBMISSION_STATUSES = ('new', 'contacted', 'cv_sent', 'closed')
+VALID_SUBMISSION_STATUSES = frozenset(SUBMISSION_STATUSES)
+INVALID_STATUS_MESSAGE = f"Invalid status. Must be one of: {', '.join(SUBMISSION_STATUSES)}"
+
+# Salary currencies (message keeps the display order)
+CURRENCIES = ('MYR', 'USD', 'SGD', 'EUR', 'GBP', 'AUD', 'NZD')
+VALID_CURRENCIES = frozenset(CURRENCIES)
+INVALID_CURRENCY_MESSAGE = f"Invalid currency. Must be one of: {', '.join(CURRENCIES)}"
+
+# Free-text submission fields: (section, field, max length, label, required)
+SUBMISSION_TEXT_FIELDS = (
+    ("recruiter", "name", 100, "Recruiter name", True),
+    ("recruiter", "agency", 200, "Agency", False),
+    ("job", "title", 200, "Job title", True),
+    ("job", "company", 200, "Company name", True),
+    ("job", "requirements", 2000, "Requirements", True),
+    ("job", "description", 5000, "Description", False),
+)
 
 
 def validate_status(status: str) -> Tuple[bool, str]:
     """Validate status value"""
-    valid_statuses = ['new', 'contacted', 'cv_sent', 'closed']
-    if status not in valid_statuses:
-        return False, f"Invalid status. Must be one of: {', '.join(valid_statuses)}"
+    if not isinstance(status, str) or status not in VALID_SUBMISSION_STATUSES:
+        return False, INVALID_STATUS_MESSAGE
     return True, ""
 
 
@@ -304,42 +524,51 @@ def sanitize_for_display(value: str) -> str:
     return escape(value)
 
 
+# Response headers shared by every API response
+_DEFAULT_HEADERS = {
+    'Content-Type': 'application/json',
+    # CORS headers (Access-Control-Allow-Origin is set per request)
+    'Access-Control-Allow-Headers': 'Content-Type,Authorization',
+    'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS',
+    'Access-Control-Allow-Credentials': 'false',
+    # Security headers
+    'X-Content-Type-Options': 'nosniff',  # Prevent MIME type sniffing
+    'X-Frame-Options': 'DENY',  # Prevent clickjacking
+    'X-XSS-Protection': '1; mode=block',  # Enable XSS filter
+    'Strict-Transport-Security': 'max-age=31536000; includeSubDomains',  # Force HTTPS
+    'Content-Security-Policy': "default-src 'self'",  # Restrict resource loading
+    'Referrer-Policy': 'strict-origin-when-cross-origin',  # Control referrer information
+    'Permissions-Policy': 'geolocation=(), microphone=(), camera=()'  # Restrict browser features
+}
+
+
+# Complete header set per allowed origin, shared by responses without extra
+# headers (plain dicts so the runtime can serialize them; never mutate)
+_ORIGIN_HEADERS = {
+    origin: {**_DEFAULT_HEADERS, 'Access-Control-Allow-Origin': origin}
+    for origin in ALLOWED_ORIGINS
+}
+
+
 def _response(status_code: int, body: Dict[str, Any], headers: Optional[Dict] = None, event: Optional[Dict] = None) -> Dict:
     """Build API Gateway response with secure CORS"""
     # Get origin from request
     origin = ''
     if event:
-        request_headers = event.get('headers', {})
+        request_headers = event.get('headers') or {}
         origin = request_headers.get('origin') or request_headers.get('Origin', '')
 
     # Check if origin is allowed
-    allowed_origin = ALLOWED_ORIGINS[0]  # Default to first allowed origin
-    if origin in ALLOWED_ORIGINS:
-        allowed_origin = origin
-
-    default_headers = {
-        'Content-Type': 'application/json',
-        # CORS headers
-        'Access-Control-Allow-Origin': allowed_origin,
-        'Access-Control-Allow-Headers': 'Content-Type,Authorization',
-        'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS',
-        'Access-Control-Allow-Credentials': 'false',
-        # Security headers
-        'X-Content-Type-Options': 'nosniff',  # Prevent MIME type sniffing
-        'X-Frame-Options': 'DENY',  # Prevent clickjacking
-        'X-XSS-Protection': '1; mode=block',  # Enable XSS filter
-        'Strict-Transport-Security': 'max-age=31536000; includeSubDomains',  # Force HTTPS
-        'Content-Security-Policy': "default-src 'self'",  # Restrict resource loading
-        'Referrer-Policy': 'strict-origin-when-cross-origin',  # Control referrer information
-        'Permissions-Policy': 'geolocation=(), microphone=(), camera=()'  # Restrict browser features
-    }
+    allowed_origin = origin if origin in ALLOWED_ORIGINS else DEFAULT_ORIGIN
+
+    response_headers = _ORIGIN_HEADERS[allowed_origin]
     if headers:
-        default_headers.update(headers)
+        response_headers = {**response_headers, **headers}
 
     return {
         'statusCode': status_code,
-        'headers': default_headers,
-        'body': json.dumps(body, ensure_ascii=False, indent=2)
+        'headers': response_headers,
+        'body': _json_dumps(body, pretty=PRETTY_JSON).decode('utf-8')
     }
 
 
@@ -355,10 +584,10 @@ def _error_response(status_code: int, message: str, error_type: str = 'Error', e
         internal_error: Optional internal error details (logged but not sent to client)
     """
     # Log full error details server-side
-    log_message = f"{error_type}: {message}"
     if internal_error:
-        log_message += f" | Internal: {internal_error}"
-    logger.error(log_message)
+        logger.error("%s: %s | Internal: %s", error_type, message, internal_error)
+    else:
+        logger.error("%s: %s", error_type, message)
 
     # Return sanitized message to client
     return _response(status_code, {
@@ -367,75 +596,303 @@ def _error_response(status_code: int, message: str, error_type: str = 'Error', e
     }, event=event)
 
 
+# ========== LIST INDEX (DYNAMODB) ==========
+# meta.json stays the source of truth. When USE_DYNAMODB is enabled, a summary
+# item per application and per recruiter submission is kept in the index
+# table so the list endpoints are a single Query instead of one S3 GET per item.
+#   pk = 'APPLICATION' | 'SUBMISSION', sk = application_id | submission_id
+#   gsi1pk = '<pk>#<status>', gsi1sk = created_at
+
+INDEX_PK_APPLICATION = 'APPLICATION'
+INDEX_PK_SUBMISSION = 'SUBMISSION'
+
+
+def _application_summary(meta: Dict) -> Dict:
+    """Summary fields returned by GET /applications (not full meta)"""
+    return {
+        "application_id": meta.get("application_id"),
+        "created_at": meta.get("created_at"),
+        "updated_at": meta.get("updated_at"),
+        "status": meta.get("status"),
+        "job_title": meta.get("job_title"),
+        "company_name": meta.get("company_name"),
+        "agency_name": meta.get("agency_name"),
+        "salary_max": meta.get("salary", {}).get("max"),
+        "tags": meta.get("tags", [])
+    }
+
+
+def _submission_summary(meta: Dict) -> Dict:
+    """Summary fields returned by GET /recruiter-submissions (not full meta)"""
+    return {
+        "submission_id": meta.get("submission_id"),
+        "created_at": meta.get("created_at"),
+        "updated_at": meta.get("updated_at"),
+        "status": meta.get("status"),
+        "recruiter_name": meta.get("recruiter", {}).get("name"),
+        "recruiter_email": meta.get("recruiter", {}).get("email"),
+        "job_title": meta.get("job", {}).get("title"),
+        "company": meta.get("job", {}).get("company"),
+        "salary_max": meta.get("job", {}).get("salary_max")
+    }
+
+
+def _index_put(pk: str, item_id: str, summary: Dict) -> None:
+    """Upsert a list summary in the DynamoDB index (failures are logged, not raised)"""
+    if not USE_DYNAMODB:
+        return
+
+    item = {
+        'pk': {'S': pk},
+        'sk': {'S': item_id},
+        'summary': {'S': _json_dumps(summary).decode('utf-8')}
+    }
+    # Older meta.json files may lack these; GSI key values can't be empty, so
+    # such items are left out of the status index rather than failing the put
+    created_at = summary.get('created_at')
+    if created_at:
+        item['gsi1pk'] = {'S': f"{pk}#{summary.get('status') or ''}"}
+        item['gsi1sk'] = {'S': created_at}
+
+    try:
+        _dynamodb().put_item(TableName=DYNAMODB_TABLE, Item=item)
+    except (ClientError, ParamValidationError) as e:
+        logger.warning("Could not index %s %s: %s", pk, item_id, e)
+
+
+def _index_put_application(meta: Dict) -> None:
+    """Upsert application summary in the DynamoDB index"""
+    _index_put(INDEX_PK_APPLICATION, meta['application_id'], _application_summary(meta))
+
+
+def _index_put_submission(meta: Dict) -> None:
+    """Upsert recruiter submission summary in the DynamoDB index"""
+    _index_put(INDEX_PK_SUBMISSION, meta['submission_id'], _submission_summary(meta))
+
+
+def _index_delete_application(app_id: str) -> None:
+    """Remove application from the DynamoDB index (failures are logged, not raised)"""
+    if not USE_DYNAMODB:
+        return
+
+    try:
+        _dynamodb().delete_item(
+            TableName=DYNAMODB_TABLE,
+            Key={
+                'pk': {'S': INDEX_PK_APPLICATION},
+                'sk': {'S': app_id}
+            }
+        )
+    except ClientError as e:
+        logger.warning("Could not remove application %s from index: %s", app_id, e)
+
+
+def _index_has_application(app_id: str) -> bool:
+    """Check whether application exists in the DynamoDB index (key-only read)"""
+    response = _dynamodb().get_item(
+        TableName=DYNAMODB_TABLE,
+        Key={
+            'pk': {'S': INDEX_PK_APPLICATION},
+            'sk': {'S': app_id}
+        },
+        ProjectionExpression='sk'
+    )
+    return 'Item' in response
+
+
+def _index_query(pk: str, status_filter: Optional[str], limit: int) -> List[Dict]:
+    """List summaries under an index partition (APPLICATION or SUBMISSION), newest first"""
+    if status_filter:
+        # Status filter is served by GSI1, so only matching items are read
+        query_params = {
+            'IndexName': 'GSI1',
+            'KeyConditionExpression': 'gsi1pk = :pk',
+            'ExpressionAttributeValues': {':pk': {'S': f"{pk}#{status_filter}"}}
+        }
+    else:
+        query_params = {
+            'KeyConditionExpression': 'pk = :pk',
+            'ExpressionAttributeValues': {':pk': {'S': pk}}
+        }
+
+    paginator = _dynamodb().get_paginator('query')
+    page_iterator = paginator.paginate(
+        TableName=DYNAMODB_TABLE,
+        ProjectionExpression='summary',
+        ScanIndexForward=False,
+        PaginationConfig={'MaxItems': limit},
+        **query_params
+    )
+
+    summaries = []
+    for page in page_iterator:
+        for item in page.get('Items', []):
+            summaries.append(_json_loads(item['summary']['S']))
+            if len(summaries) >= limit:
+                return summaries
+
+    return summaries
+
+
+def _get_meta_cached(meta_key: str) -> Dict:
+    """
+    Read a meta.json object through the warm-container cache: a conditional GET
+    returns 304 with no body when the cached ETag is current. The returned
+    dict is shared, so callers must copy before mutating. Raises ClientError.
+    """
+    with _meta_cache_lock:
+        cached = _meta_cache.get(meta_key)
+
+    try:
+        if cached:
+            obj = _s3().get_object(Bucket=BUCKET_NAME, Key=meta_key, IfNoneMatch=cached[0])
+        else:
+            obj = _s3().get_object(Bucket=BUCKET_NAME, Key=meta_key)
+    except ClientError as e:
+        code = e.response['Error']['Code']
+        if cached and code in ('304', 'NotModified'):
+            with _meta_cache_lock:
+                if meta_key in _meta_cache:
+                    _meta_cache.move_to_end(meta_key)
+            return cached[1]
+        if code == 'NoSuchKey':
+            with _meta_cache_lock:
+                _meta_cache.pop(meta_key, None)
+        raise
+
+    meta = _json_loads(obj['Body'].read())
+    with _meta_cache_lock:
+        _meta_cache[meta_key] = (obj['ETag'], meta)
+        _meta_cache.move_to_end(meta_key)
+        while len(_meta_cache) > META_CACHE_SIZE:
+            _meta_cache.popitem(last=False)
+    return meta
+
+
+def _load_meta(meta_key: str) -> Optional[Dict]:
+    """Read a meta.json object (cached, read-only), returning None if it can't be read"""
+    try:
+        return _get_meta_cached(meta_key)
+    except ClientError as e:
+        logger.warning("Could not read %s: %s", meta_key, e)
+        return None
+
+
+def _meta_keys(prefix: str) -> List[str]:
+    """All {prefix}{year}/{id}/meta.json keys, newest first"""
+    # One flat listing of the prefix (1000 keys per page) instead of
+    # walking year folders then item folders
+    paginator = _s3().get_paginator('list_objects_v2')
+    page_iterator = paginator.paginate(
+        Bucket=BUCKET_NAME,
+        Prefix=prefix,
+        PaginationConfig={'PageSize': 1000}
+    )
+
+    # Listing is cheap next to the GETs; {app,rec}_{date}_{id} keys sort by date
+    meta_keys = [
+        obj['Key']
+        for page in page_iterator
+        for obj in page.get('Contents', [])
+        if obj['Key'].endswith('/meta.json')
+    ]
+    meta_keys.sort(reverse=True)
+    return meta_keys
+
+
+def _scan_applications(status_filter: Optional[str], limit: int) -> List[Dict]:
+    """List application summaries by listing applications/ and reading every meta.json"""
+    meta_keys = _meta_keys('applications/')
+
+    # Without a status filter every readable key yields a result, so only
+    # fetch the newest `limit` of them
+    if not status_filter:
+        meta_keys = meta_keys[:limit]
+
+    # Fetch meta.json objects concurrently (boto3 clients are thread-safe);
+    # map() keeps key order, so the limit keeps the newest matches
+    applications = []
+    with ThreadPoolExecutor(max_workers=LIST_MAX_WORKERS) as executor:
+        for meta in executor.map(_load_meta, meta_keys):
+            if meta is None:
+                continue
+
+            # Apply status filter if provided
+            if status_filter and meta.get('status') != status_filter:
+                continue
+
+            applications.append(_application_summary(meta))
+
+            # Limit results
+            if len(applications) >= limit:
+                break
+
+    return applications
+
+
+def rebuild_index() -> Dict:
+    """
+    Backfill the DynamoDB index from every meta.json in the bucket
+    Run once after enabling EnableDynamoDB so existing items are listed,
+    by invoking the function directly with {"action": "rebuild-index"}
+    """
+    if not USE_DYNAMODB:
+        return {"indexed": 0, "error": "DynamoDB index is not enabled"}
+
+    indexed = {}
+    with ThreadPoolExecutor(max_workers=LIST_MAX_WORKERS) as executor:
+        for prefix, index_put in (('applications/', _index_put_application),
+                                  ('recruiters/', _index_put_submission)):
+            count = 0
+            for meta in executor.map(_load_meta, _meta_keys(prefix)):
+                if meta is None:
+                    continue
+                index_put(meta)
+                count += 1
+            indexed[prefix.rstrip('/')] = count
+
+    logger.info("Rebuilt list index: %s", indexed)
+    return {"indexed": indexed}
+
+
 def create_application(event: Dict) -> Dict:
     """
     POST /applications
     Create new job application
     """
     try:
-        body = json.loads(event.get('body') or '{}')
+        body = _parse_body(event)
+
+        # One timestamp for the ID date, created_at and updated_at
+        now = _utc_now()
 
         # Generate application ID
-        app_id = _generate_app_id()
+        app_id = _generate_app_id(now[:10])
         prefix = _app_prefix(app_id)
 
         # Build metadata following the schema
         meta = {
             "application_id": app_id,
-            "created_at": _utc_now(),
-            "updated_at": _utc_now(),
-            "status": body.get("status", "applied"),
-            "job_title": body.get("job_title", ""),
-            "agency_name": body.get("agency_name", ""),
-            "company_name": body.get("company_name", ""),
-            "caller": {
-                "name": body.get("caller", {}).get("name", ""),
-                "email": body.get("caller", {}).get("email", ""),
-                "phone": body.get("caller", {}).get("phone", "")
-            },
-            "caller_method": body.get("caller_method", ""),
-            "salary": {
-                "currency": body.get("salary", {}).get("currency", "MYR"),
-                "min": body.get("salary", {}).get("min", 0),
-                "max": body.get("salary", {}).get("max", 0),
-                "period": body.get("salary", {}).get("period", "monthly")
-            },
-            "perks": body.get("perks", []),
-            "details": {
-                "roles": body.get("details", {}).get("roles", ""),
-                "responsibilities": body.get("details", {}).get("responsibilities", []),
-                "skillsets": body.get("details", {}).get("skillsets", []),
-                "questions_asked": body.get("details", {}).get("questions_asked", []),
-                "info_provided": body.get("details", {}).get("info_provided", [])
-            },
+            "created_at": now,
+            "updated_at": now,
+            **_with_defaults(_APPLICATION_DEFAULTS, body),
             "cv_key": f"{prefix}cv.pdf",
-            "tags": body.get("tags", [])
+            "cv_uploaded": False  # Set by file_validator once the CV passes validation
         }
 
         # Save metadata to S3
-        s3.put_object(
+        _s3().put_object(
             Bucket=BUCKET_NAME,
             Key=f"{prefix}meta.json",
-            Body=json.dumps(meta, ensure_ascii=False, indent=2).encode('utf-8'),
+            Body=_json_dumps(meta),
             ContentType="application/json",
-            Metadata={
-                'application-id': app_id,
-                'created-at': meta['created_at']
-            }
         )
+        _index_put_application(meta)
 
         # Generate presigned URL for CV upload
-        cv_upload_url = s3.generate_presigned_url(
-            ClientMethod='put_object',
-            Params={
-                "Bucket": BUCKET_NAME,
-                "Key": meta["cv_key"],
-                "ContentType": "application/pdf"
-            },
-            ExpiresIn=PRESIGNED_URL_EXPIRY
-        )
+        cv_upload_url = _presign_put(meta["cv_key"], PRESIGNED_URL_EXPIRY)
 
-        logger.info(f"Created application: {app_id}")
+        logger.info("Created application: %s", app_id)
 
         return _response(200, {
             "application_id": app_id,
@@ -464,80 +921,17 @@ def list_applications(event: Dict) -> Dict:
         status_filter = query_params.get('status')
         limit = min(int(query_params.get('limit', '100')), 1000)
 
-        applications = []
-
-        # List all year folders
-        logger.info(f"Listing applications from bucket: {BUCKET_NAME}")
-
-        # List applications prefix
-        paginator = s3.get_paginator('list_objects_v2')
-        page_iterator = paginator.paginate(
-            Bucket=BUCKET_NAME,
-            Prefix='applications/',
-            Delimiter='/'
-        )
-
-        # Get all year folders
-        years = []
-        for page in page_iterator:
-            for prefix in page.get('CommonPrefixes', []):
-                year_prefix = prefix['Prefix']
-                years.append(year_prefix)
-
-        # For each year, list applications
-        for year_prefix in years:
-            app_paginator = s3.get_paginator('list_objects_v2')
-            app_page_iterator = app_paginator.paginate(
-                Bucket=BUCKET_NAME,
-                Prefix=year_prefix,
-                Delimiter='/'
-            )
-
-            for page in app_page_iterator:
-                for app_prefix in page.get('CommonPrefixes', []):
-                    app_folder = app_prefix['Prefix']
-                    meta_key = f"{app_folder}meta.json"
-
-                    try:
-                        # Get meta.json for each application
-                        obj = s3.get_object(Bucket=BUCKET_NAME, Key=meta_key)
-                        meta = json.loads(obj['Body'].read().decode('utf-8'))
-
-                        # Apply status filter if provided
-                        if status_filter and meta.get('status') != status_filter:
-                            continue
-
-                        # Add summary info (not full meta)
-                        applications.append({
-                            "application_id": meta.get("application_id"),
-                            "created_at": meta.get("created_at"),
-                            "updated_at": meta.get("updated_at"),
-                            "status": meta.get("status"),
-                            "job_title": meta.get("job_title"),
-                            "company_name": meta.get("company_name"),
-                            "agency_name": meta.get("agency_name"),
-                            "salary_max": meta.get("salary", {}).get("max"),
-                            "tags": meta.get("tags", [])
-                        })
-
-                        # Limit results
-                        if len(applications) >= limit:
-                            break
-
-                    except ClientError as e:
-                        logger.warning(f"Could not read {meta_key}: {str(e)}")
-                        continue
-
-                if len(applications) >= limit:
-                    break
-
-            if len(applications) >= limit:
-                break
+        if USE_DYNAMODB:
+            logger.info("Listing applications from index: %s", DYNAMODB_TABLE)
+            applications = _index_query(INDEX_PK_APPLICATION, status_filter, limit)
+        else:
+            logger.info("Listing applications from bucket: %s", BUCKET_NAME)
+            applications = _scan_applications(status_filter, limit)
 
         # Sort by created_at descending (newest first)
         applications.sort(key=lambda x: x.get('created_at', ''), reverse=True)
 
-        logger.info(f"Found {len(applications)} applications")
+        logger.info("Found %s applications", len(applications))
 
         return _response(200, {
             "applications": applications,
@@ -555,6 +949,18 @@ def list_applications(event: Dict) -> Dict:
         return _error_response(500, "An unexpected error occurred", "InternalError", event=event, internal_error=str(e))
 
 
+def _cv_uploaded(meta: Dict, cv_key: str) -> bool:
+    """Whether the application's CV exists (flag set by file_validator, else HEAD)"""
+    if 'cv_uploaded' in meta:
+        return bool(meta['cv_uploaded'])
+
+    try:
+        _s3().head_object(Bucket=BUCKET_NAME, Key=cv_key)
+        return True
+    except ClientError:
+        return False
+
+
 def get_application(event: Dict) -> Dict:
     """
     GET /applications/{id}
@@ -572,36 +978,25 @@ def get_application(event: Dict) -> Dict:
         meta_key = f"{prefix}meta.json"
 
         try:
-            obj = s3.get_object(Bucket=BUCKET_NAME, Key=meta_key)
-            meta = json.loads(obj['Body'].read().decode('utf-8'))
+            meta = dict(_get_meta_cached(meta_key))  # Copy; download URL fields are added below
         except ClientError as e:
             if e.response['Error']['Code'] == 'NoSuchKey':
                 return _error_response(404, f"Application not found: {app_id}", "NotFound")
             raise
 
-        # Generate presigned download URL for CV
+        # Generate presigned download URL for CV. The file validator records
+        # cv_uploaded in meta.json; only older applications without the flag
+        # need an existence probe
         cv_key = meta.get("cv_key")
         cv_download_url = None
 
-        if cv_key:
-            try:
-                # Check if CV exists
-                s3.head_object(Bucket=BUCKET_NAME, Key=cv_key)
-                cv_download_url = s3.generate_presigned_url(
-                    ClientMethod='get_object',
-                    Params={
-                        "Bucket": BUCKET_NAME,
-                        "Key": cv_key
-                    },
-                    ExpiresIn=PRESIGNED_URL_EXPIRY
-                )
-            except ClientError:
-                logger.warning(f"CV not found for {app_id}: {cv_key}")
+        if cv_key and _cv_uploaded(meta, cv_key):
+            cv_download_url = _presign_get(cv_key, PRESIGNED_URL_EXPIRY)
 
         meta["cv_download_url"] = cv_download_url
         meta["cv_download_url_expires_in"] = PRESIGNED_URL_EXPIRY if cv_download_url else None
 
-        logger.info(f"Retrieved application: {app_id}")
+        logger.info("Retrieved application: %s", app_id)
 
         return _response(200, meta)
 
@@ -626,15 +1021,16 @@ def update_application(event: Dict) -> Dict:
         if not app_id:
             return _error_response(400, "Missing application ID", "InvalidRequest")
 
-        body = json.loads(event.get('body') or '{}')
+        body = _parse_body(event)
 
         # Get existing metadata
         prefix = _app_prefix(app_id)
         meta_key = f"{prefix}meta.json"
 
         try:
-            obj = s3.get_object(Bucket=BUCKET_NAME, Key=meta_key)
-            meta = json.loads(obj['Body'].read().decode('utf-8'))
+            obj = _s3().get_object(Bucket=BUCKET_NAME, Key=meta_key)
+            meta = _json_loads(obj['Body'].read())
+            etag = obj['ETag']
         except ClientError as e:
             if e.response['Error']['Code'] == 'NoSuchKey':
                 return _error_response(404, f"Application not found: {app_id}", "NotFound")
@@ -653,19 +1049,22 @@ def update_application(event: Dict) -> Dict:
         # Update timestamp
         meta['updated_at'] = _utc_now()
 
-        # Save updated metadata
-        s3.put_object(
-            Bucket=BUCKET_NAME,
-            Key=meta_key,
-            Body=json.dumps(meta, ensure_ascii=False, indent=2).encode('utf-8'),
-            ContentType="application/json",
-            Metadata={
-                'application-id': app_id,
-                'updated-at': meta['updated_at']
-            }
-        )
+        # Save updated metadata only if nobody else wrote it since our read
+        try:
+            _s3().put_object(
+                Bucket=BUCKET_NAME,
+                Key=meta_key,
+                Body=_json_dumps(meta),
+                ContentType="application/json",
+                IfMatch=etag
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] in WRITE_CONFLICT_CODES:
+                return _error_response(409, f"Application was modified concurrently, retry the update: {app_id}", "Conflict")
+            raise
+        _index_put_application(meta)
 
-        logger.info(f"Updated application: {app_id}")
+        logger.info("Updated application: %s", app_id)
 
         return _response(200, {
             "application_id": app_id,
@@ -699,29 +1098,45 @@ def delete_application(event: Dict) -> Dict:
         # Delete all objects in the application folder
         prefix = _app_prefix(app_id)
 
-        # List all objects with this prefix
-        objects_to_delete = []
-        paginator = s3.get_paginator('list_objects_v2')
-
-        for page in paginator.paginate(Bucket=BUCKET_NAME, Prefix=prefix):
-            for obj in page.get('Contents', []):
-                objects_to_delete.append({'Key': obj['Key']})
+        # Stream list pages straight into DeleteObjects calls so deletes overlap
+        # the remaining LIST requests (a page is at most 1000 keys, the
+        # DeleteObjects per-call limit)
+        files_deleted = 0
+        futures = []
+        paginator = _s3().get_paginator('list_objects_v2')
 
-        if not objects_to_delete:
+        with ThreadPoolExecutor(max_workers=DELETE_MAX_WORKERS) as executor:
+            for page in paginator.paginate(
+                Bucket=BUCKET_NAME,
+                Prefix=prefix,
+                PaginationConfig={'PageSize': DELETE_BATCH_SIZE}
+            ):
+                batch = [{'Key': obj['Key']} for obj in page.get('Contents', [])]
+                if not batch:
+                    continue
+                files_deleted += len(batch)
+                futures.append(executor.submit(
+                    _s3().delete_objects,
+                    Bucket=BUCKET_NAME,
+                    Delete={'Objects': batch, 'Quiet': True}
+                ))
+
+            # Quiet mode only reports keys that failed
+            for future in as_completed(futures):
+                for error in future.result().get('Errors', []):
+                    logger.warning("Failed to delete %s: %s", error.get('Key'), error.get('Code'))
+
+        if not files_deleted:
             return _error_response(404, f"Application not found: {app_id}", "NotFound")
 
-        # Delete all objects
-        s3.delete_objects(
-            Bucket=BUCKET_NAME,
-            Delete={'Objects': objects_to_delete}
-        )
+        _index_delete_application(app_id)
 
-        logger.info(f"Deleted application: {app_id} ({len(objects_to_delete)} files)")
+        logger.info("Deleted application: %s (%s files)", app_id, files_deleted)
 
         return _response(200, {
             "application_id": app_id,
             "deleted": True,
-            "files_deleted": len(objects_to_delete)
+            "files_deleted": files_deleted
         })
 
     except ValueError as e:
@@ -745,30 +1160,29 @@ def get_cv_upload_url(event: Dict) -> Dict:
         if not app_id:
             return _error_response(400, "Missing application ID", "InvalidRequest")
 
-        # Verify application exists
-        prefix = _app_prefix(app_id)
-        meta_key = f"{prefix}meta.json"
+        # Validate ID format to prevent path traversal
+        if not validate_id_format(app_id, 'app'):
+            return _error_response(400, "Invalid application ID format", "ValidationError", event=event)
 
-        try:
-            s3.head_object(Bucket=BUCKET_NAME, Key=meta_key)
-        except ClientError as e:
-            if e.response['Error']['Code'] == '404':
+        prefix = _app_prefix(app_id)
+        # Verify application exists: a key-only index read when the index is
+        # enabled, otherwise a HEAD of meta.json
+        if USE_DYNAMODB:
+            if not _index_has_application(app_id):
                 return _error_response(404, f"Application not found: {app_id}", "NotFound")
-            raise
+        else:
+            try:
+                _s3().head_object(Bucket=BUCKET_NAME, Key=f"{prefix}meta.json")
+            except ClientError as e:
+                if e.response['Error']['Code'] == '404':
+                    return _error_response(404, f"Application not found: {app_id}", "NotFound")
+                raise
 
         # Generate presigned URL for CV upload
         cv_key = f"{prefix}cv.pdf"
-        cv_upload_url = s3.generate_presigned_url(
-            ClientMethod='put_object',
-            Params={
-                "Bucket": BUCKET_NAME,
-                "Key": cv_key,
-                "ContentType": "application/pdf"
-            },
-            ExpiresIn=PRESIGNED_URL_EXPIRY
-        )
+        cv_upload_url = _presign_put(cv_key, PRESIGNED_URL_EXPIRY)
 
-        logger.info(f"Generated CV upload URL for: {app_id}")
+        logger.info("Generated CV upload URL for: %s", app_id)
 
         return _response(200, {
             "application_id": app_id,
@@ -791,24 +1205,122 @@ def get_cv_upload_url(event: Dict) -> Dict:
 # RECRUITER SUBMISSION FUNCTIONS
 # ============================================================================
 
+def _queue_submission_email(rec_id: str) -> bool:
+    """Invoke this function asynchronously to send the submission email (False if it couldn't be queued)"""
+    function_name = os.environ.get('AWS_LAMBDA_FUNCTION_NAME')
+    if not function_name:
+        return False  # Not running in Lambda (local runs send inline)
+
+    try:
+        _lambda().invoke(
+            FunctionName=function_name,
+            InvocationType='Event',
+            Payload=_json_dumps({"action": "send-submission-email", "submission_id": rec_id})
+        )
+        return True
+    except (ClientError, BotoCoreError) as e:
+        # Never let the notification fail a submission that is already stored
+        logger.warning("Could not queue email for %s, sending inline: %s", rec_id, e)
+        return False
+
+
+def _has_auto_email(meta: Dict) -> bool:
+    """Whether the automatic submission email has already been recorded"""
+    return any(entry.get('trigger') == 'auto' for entry in meta.get('email_history') or ())
+
+
+def _send_submission_email(rec_id: str, meta: Dict) -> str:
+    """Send the automatic submission email and record it in email_history; returns the status"""
+    notifier = _email_ses()
+    try:
+        # Note: CV will be uploaded later via presigned URL
+        # Email notification will be sent without CV initially
+        success, message = notifier.send_application_notification(meta, cv_info=None)
+        if success:
+            email_status = "sent"
+            logger.info("Email notification sent via SES: %s", message)
+            entry = {'status': 'sent', 'message_id': message}
+        else:
+            email_status = "failed"
+            logger.warning("Email notification failed: %s", message)
+            entry = {'status': 'failed', 'error': message}
+    except Exception as e:
+        email_status = "error"
+        logger.exception("Error sending email notification: %s", e)
+        entry = {'status': 'error', 'error': str(e)}
+
+    history_entry = {
+        'sent_at': _utc_now(),
+        **entry,
+        'sent_by': 'system',
+        'trigger': 'auto'
+    }
+
+    def append_history(current: Dict) -> bool:
+        # A duplicate async delivery must not record the email twice
+        if _has_auto_email(current):
+            return False
+        current.setdefault('email_history', []).append(history_entry)
+        return True
+
+    # Conditional append, so admin changes made since the email was queued survive
+    try:
+        _update_submission_meta(rec_id, append_history)
+    except ClientError as e:
+        logger.warning("Could not record email history for %s: %s", rec_id, e)
+
+    return email_status
+
+
+def send_submission_email(rec_id: str) -> Dict:
+    """
+    Async invocation target for {"action": "send-submission-email", "submission_id": ...}
+    Sends the automatic notification for a newly created submission
+    """
+    if not validate_id_format(rec_id, 'rec'):
+        return {"email_notification": "invalid", "submission_id": rec_id}
+
+    notifier = _email_ses()
+    if not notifier or not notifier.is_ses_enabled():
+        return {"email_notification": "disabled", "submission_id": rec_id}
+
+    meta_key = f"{_rec_prefix(rec_id)}meta.json"
+    obj = _s3().get_object(Bucket=BUCKET_NAME, Key=meta_key)
+    meta = _json_loads(obj['Body'].read())
+
+    # Async invocations can be delivered more than once
+    if _has_auto_email(meta):
+        logger.info("Submission email for %s already sent, skipping", rec_id)
+        return {"email_notification": "duplicate", "submission_id": rec_id}
+
+    return {"email_notification": _send_submission_email(rec_id, meta), "submission_id": rec_id}
+
+
 def create_recruiter_submission(event: Dict) -> Dict:
     """
     POST /recruiter-submissions
     Create new recruiter submission with comprehensive input validation
     """
     try:
-        body = json.loads(event.get('body') or '{}')
+        body = _parse_body(event)
 
         # ========== INPUT VALIDATION ==========
-        # Validate recruiter information
-        recruiter_name = body.get("recruiter", {}).get("name", "")
-        recruiter_email = body.get("recruiter", {}).get("email", "")
-        recruiter_phone = body.get("recruiter", {}).get("phone", "")
-        recruiter_agency = body.get("recruiter", {}).get("agency", "")
-
-        valid, error = validate_string(recruiter_name, 100, "Recruiter name")
-        if not valid:
-            return _error_response(400, error, "ValidationError", event=event)
+        sections = {"recruiter": body.get("recruiter", {}), "job": body.get("job", {})}
+        recruiter, job = sections["recruiter"], sections["job"]
+
+        for section, field, max_length, label, required in SUBMISSION_TEXT_FIELDS:
+            valid, error = validate_string(sections[section].get(field, ""), max_length, label, required=required)
+            if not valid:
+                return _error_response(400, error, "ValidationError", event=event)
+
+        recruiter_name = recruiter.get("name", "")
+        recruiter_email = recruiter.get("email", "")
+        recruiter_phone = recruiter.get("phone", "")
+        recruiter_agency = recruiter.get("agency", "")
+        job_title = job.get("title", "")
+        job_company = job.get("company", "")
+        job_requirements = job.get("requirements", "")
+        job_description = job.get("description", "")
 
         valid, error = validate_email(recruiter_email)
         if not valid:
@@ -818,35 +1330,9 @@ def create_recruiter_submission(event: Dict) -> Dict:
         if not valid:
             return _error_response(400, error, "ValidationError", event=event)
 
-        valid, error = validate_string(recruiter_agency, 200, "Agency", required=False)
-        if not valid:
-            return _error_response(400, error, "ValidationError", event=event)
-
-        # Validate job information
-        job_title = body.get("job", {}).get("title", "")
-        job_company = body.get("job", {}).get("company", "")
-        job_requirements = body.get("job", {}).get("requirements", "")
-        job_description = body.get("job", {}).get("description", "")
-
-        valid, error = validate_string(job_title, 200, "Job title")
-        if not valid:
-            return _error_response(400, error, "ValidationError", event=event)
-
-        valid, error = validate_string(job_company, 200, "Company name")
-        if not valid:
-            return _error_response(400, error, "ValidationError", event=event)
-
-        valid, error = validate_string(job_requirements, 2000, "Requirements")
-        if not valid:
-            return _error_response(400, error, "ValidationError", event=event)
-
-        valid, error = validate_string(job_description, 5000, "Description", required=False)
-        if not valid:
-            return _error_response(400, error, "ValidationError", event=event)
-
         # Validate salary
-        salary_min = body.get("job", {}).get("salary_min", 0)
-        salary_max = body.get("job", {}).get("salary_max", 0)
+        salary_min = job.get("salary_min", 0)
+        salary_max = job.get("salary_max", 0)
 
         if not isinstance(salary_min, (int, float)) or salary_min < 0:
             return _error_response(400, "salary_min must be a non-negative number", "ValidationError", event=event)
@@ -858,40 +1344,38 @@ def create_recruiter_submission(event: Dict) -> Dict:
             return _error_response(400, "salary_min cannot exceed salary_max", "ValidationError", event=event)
 
         # Validate currency
-        valid_currencies = ['MYR', 'USD', 'SGD', 'EUR', 'GBP', 'AUD', 'NZD']
-        currency = body.get("job", {}).get("currency", "MYR")
-        if currency not in valid_currencies:
-            return _error_response(400, f"Invalid currency. Must be one of: {', '.join(valid_currencies)}", "ValidationError", event=event)
+        currency = job.get("currency", "MYR")
+        if not isinstance(currency, str) or currency not in VALID_CURRENCIES:
+            return _error_response(400, INVALID_CURRENCY_MESSAGE, "ValidationError", event=event)
 
         # Validate skills (array of strings)
-        skills = body.get("job", {}).get("skills", [])
+        skills = job.get("skills", [])
         if not isinstance(skills, list):
             return _error_response(400, "skills must be an array", "ValidationError", event=event)
 
         if len(skills) > 50:
             return _error_response(400, "Maximum 50 skills allowed", "ValidationError", event=event)
 
-        validated_skills = []
-        for skill in skills:
-            if not isinstance(skill, str):
-                continue
-            skill = skill.strip()
-            if len(skill) > 100:
-                return _error_response(400, "Each skill must be max 100 characters", "ValidationError", event=event)
-            if skill:
-                validated_skills.append(skill)
+        # Non-string entries are dropped, blank ones skipped after stripping
+        stripped_skills = [skill.strip() for skill in skills if isinstance(skill, str)]
+        if any(len(skill) > 100 for skill in stripped_skills):
+            return _error_response(400, "Each skill must be max 100 characters", "ValidationError", event=event)
+        validated_skills = [skill for skill in stripped_skills if skill]
 
         # ========== CREATE SUBMISSION ==========
+        # One timestamp for the ID date, created_at and updated_at
+        now = _utc_now()
+
         # Generate submission ID
-        rec_id = _generate_rec_id()
+        rec_id = _generate_rec_id(now[:10])
         prefix = _rec_prefix(rec_id)
 
         # Build metadata with validated data
         meta = {
             "submission_id": rec_id,
             "type": "recruiter_submission",
-            "created_at": _utc_now(),
-            "updated_at": _utc_now(),
+            "created_at": now,
+            "updated_at": now,
             "status": "new",  # new, contacted, cv_sent, closed
             "recruiter": {
                 "name": recruiter_name,
@@ -919,81 +1403,32 @@ def create_recruiter_submission(event: Dict) -> Dict:
         }
 
         # Save metadata to S3
-        s3.put_object(
+        _s3().put_object(
             Bucket=BUCKET_NAME,
             Key=f"{prefix}meta.json",
-            Body=json.dumps(meta, ensure_ascii=False, indent=2).encode('utf-8'),
+            Body=_json_dumps(meta),
             ContentType="application/json",
             Metadata={
                 'submission-id': rec_id,
                 'created-at': meta['created_at']
             }
         )
+        _index_put_submission(meta)
 
         # Generate presigned URL for JD upload (10 min expiry)
-        jd_upload_url = s3.generate_presigned_url(
-            ClientMethod='put_object',
-            Params={
-                "Bucket": BUCKET_NAME,
-                "Key": meta["files"]["job_description"],
-                "ContentType": "application/pdf"
-            },
-            ExpiresIn=UPLOAD_URL_EXPIRY
-        )
+        jd_upload_url = _presign_put(meta["files"]["job_description"], UPLOAD_URL_EXPIRY)
 
-        logger.info(f"Created recruiter submission: {rec_id}")
+        logger.info("Created recruiter submission: %s", rec_id)
 
-        # Send Email notification via SES (non-blocking, failures don't affect submission)
+        # Email notification is sent from an async invocation so SES latency
+        # stays off the response; failures there don't affect the submission
         email_status = "disabled"
-        if EMAIL_AVAILABLE and is_ses_enabled():
-            try:
-                # Note: CV will be uploaded later via presigned URL
-                # Email notification will be sent without CV initially
-                success, message = send_email_notification(meta, cv_info=None)
-                if success:
-                    email_status = "sent"
-                    logger.info(f"Email notification sent via SES: {message}")
-
-                    # Add to email history in metadata
-                    meta['email_history'].append({
-                        'sent_at': _utc_now(),
-                        'status': 'sent',
-                        'message_id': message,
-                        'sent_by': 'system',
-                        'trigger': 'auto'
-                    })
-
-                    # Update metadata with history
-                    s3.put_object(
-                        Bucket=BUCKET_NAME,
-                        Key=f"{prefix}meta.json",
-                        Body=json.dumps(meta, ensure_ascii=False, indent=2).encode('utf-8'),
-                        ContentType="application/json"
-                    )
-                else:
-                    email_status = "failed"
-                    logger.warning(f"Email notification failed: {message}")
-
-                    # Log failure in history
-                    meta['email_history'].append({
-                        'sent_at': _utc_now(),
-                        'status': 'failed',
-                        'error': message,
-                        'sent_by': 'system',
-                        'trigger': 'auto'
-                    })
-            except Exception as e:
-                email_status = "error"
-                logger.exception(f"Error sending email notification: {str(e)}")
-
-                # Log error in history
-                meta['email_history'].append({
-                    'sent_at': _utc_now(),
-                    'status': 'error',
-                    'error': str(e),
-                    'sent_by': 'system',
-                    'trigger': 'auto'
-                })
+        notifier = _email_ses()
+        if notifier and notifier.is_ses_enabled():
+            if _queue_submission_email(rec_id):
+                email_status = "queued"
+            else:
+                email_status = _send_submission_email(rec_id, meta)
 
         return _response(200, {
             "submission_id": rec_id,
@@ -1012,6 +1447,36 @@ def create_recruiter_submission(event: Dict) -> Dict:
         return _error_response(500, "An unexpected error occurred", "InternalError", event=event, internal_error=str(e))
 
 
+def _scan_submissions(status_filter: Optional[str], limit: int) -> List[Dict]:
+    """List submission summaries by listing recruiters/ and reading every meta.json"""
+    meta_keys = _meta_keys('recruiters/')
+
+    # Without a status filter every readable key yields a result, so only
+    # fetch the newest `limit` of them
+    if not status_filter:
+        meta_keys = meta_keys[:limit]
+
+    # Fetch meta.json objects concurrently; map() keeps key order, so the
+    # limit keeps the newest matches
+    submissions = []
+    with ThreadPoolExecutor(max_workers=LIST_MAX_WORKERS) as executor:
+        for meta in executor.map(_load_meta, meta_keys):
+            if meta is None:
+                continue
+
+            # Apply status filter if provided
+            if status_filter and meta.get('status') != status_filter:
+                continue
+
+            submissions.append(_submission_summary(meta))
+
+            # Limit results
+            if len(submissions) >= limit:
+                break
+
+    return submissions
+
+
 def list_recruiter_submissions(event: Dict) -> Dict:
     """
     GET /recruiter-submissions
@@ -1023,79 +1488,17 @@ def list_recruiter_submissions(event: Dict) -> Dict:
         status_filter = query_params.get('status')
         limit = min(int(query_params.get('limit', '100')), 1000)
 
-        submissions = []
-
-        logger.info(f"Listing recruiter submissions from bucket: {BUCKET_NAME}")
-
-        # List recruiters prefix
-        paginator = s3.get_paginator('list_objects_v2')
-        page_iterator = paginator.paginate(
-            Bucket=BUCKET_NAME,
-            Prefix='recruiters/',
-            Delimiter='/'
-        )
-
-        # Get all year folders
-        years = []
-        for page in page_iterator:
-            for prefix in page.get('CommonPrefixes', []):
-                year_prefix = prefix['Prefix']
-                years.append(year_prefix)
-
-        # For each year, list submissions
-        for year_prefix in years:
-            rec_paginator = s3.get_paginator('list_objects_v2')
-            rec_page_iterator = rec_paginator.paginate(
-                Bucket=BUCKET_NAME,
-                Prefix=year_prefix,
-                Delimiter='/'
-            )
-
-            for page in rec_page_iterator:
-                for rec_prefix in page.get('CommonPrefixes', []):
-                    rec_folder = rec_prefix['Prefix']
-                    meta_key = f"{rec_folder}meta.json"
-
-                    try:
-                        # Get meta.json for each submission
-                        obj = s3.get_object(Bucket=BUCKET_NAME, Key=meta_key)
-                        meta = json.loads(obj['Body'].read().decode('utf-8'))
-
-                        # Apply status filter if provided
-                        if status_filter and meta.get('status') != status_filter:
-                            continue
-
-                        # Add summary info
-                        submissions.append({
-                            "submission_id": meta.get("submission_id"),
-                            "created_at": meta.get("created_at"),
-                            "updated_at": meta.get("updated_at"),
-                            "status": meta.get("status"),
-                            "recruiter_name": meta.get("recruiter", {}).get("name"),
-                            "recruiter_email": meta.get("recruiter", {}).get("email"),
-                            "job_title": meta.get("job", {}).get("title"),
-                            "company": meta.get("job", {}).get("company"),
-                            "salary_max": meta.get("job", {}).get("salary_max")
-                        })
-
-                        # Limit results
-                        if len(submissions) >= limit:
-                            break
-
-                    except ClientError as e:
-                        logger.warning(f"Could not read {meta_key}: {str(e)}")
-                        continue
-
-                if len(submissions) >= limit:
-                    break
-
-            if len(submissions) >= limit:
-                break
+        if USE_DYNAMODB:
+            logger.info("Listing recruiter submissions from index: %s", DYNAMODB_TABLE)
+            submissions = _index_query(INDEX_PK_SUBMISSION, status_filter, limit)
+        else:
+            logger.info("Listing recruiter submissions from bucket: %s", BUCKET_NAME)
+            submissions = _scan_submissions(status_filter, limit)
 
         # Sort by created_at descending (newest first)
         submissions.sort(key=lambda x: x.get('created_at', ''), reverse=True)
 
-        logger.info(f"Found {len(submissions)} recruiter submissions")
+        logger.info("Found %s recruiter submissions", len(submissions))
 
         return _response(200, {
             "submissions": submissions,
@@ -1113,6 +1516,12 @@ def list_recruiter_submissions(event: Dict) -> Dict:
         return _error_response(500, "An unexpected error occurred", "InternalError", event=event, internal_error=str(e))
 
 
+def _folder_keys(prefix: str) -> frozenset:
+    """Keys directly under an item folder (a submission folder holds a handful of files)"""
+    response = _s3().list_objects_v2(Bucket=BUCKET_NAME, Prefix=prefix)
+    return frozenset(obj['Key'] for obj in response.get('Contents', []))
+
+
 def get_recruiter_submission(event: Dict) -> Dict:
     """
     GET /recruiter-submissions/{id}
@@ -1130,19 +1539,28 @@ def get_recruiter_submission(event: Dict) -> Dict:
         if not validate_id_format(rec_id, 'rec'):
             return _error_response(400, "Invalid submission ID format", "ValidationError", event=event)
 
-        # Get metadata
+        # Get metadata, listing the submission folder alongside so file
+        # existence costs no extra round-trip (one listing instead of a HEAD per file)
         prefix = _rec_prefix(rec_id)
         meta_key = f"{prefix}meta.json"
 
-        try:
-            obj = s3.get_object(Bucket=BUCKET_NAME, Key=meta_key)
-            meta = json.loads(obj['Body'].read().decode('utf-8'))
-        except ClientError as e:
-            if e.response['Error']['Code'] == 'NoSuchKey':
-                return _error_response(404, f"Submission not found: {rec_id}", "NotFound", event=event)
-            raise
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            folder_listing = executor.submit(_folder_keys, prefix)
+            try:
+                obj = _s3().get_object(Bucket=BUCKET_NAME, Key=meta_key)
+                meta = _json_loads(obj['Body'].read())
+            except ClientError as e:
+                if e.response['Error']['Code'] == 'NoSuchKey':
+                    return _error_response(404, f"Submission not found: {rec_id}", "NotFound", event=event)
+                raise
+
+            try:
+                existing_keys = folder_listing.result()
+            except ClientError as e:
+                logger.warning("Could not list files for %s: %s", rec_id, e)
+                existing_keys = frozenset()
 
-        # Generate presigned download URLs (5 min expiry)
+        # Generate presigned download URLs (5 min expiry) for uploaded files only
         jd_key = meta.get("files", {}).get("job_description")
         cv_key = meta.get("files", {}).get("customized_cv")
 
@@ -1150,26 +1568,16 @@ def get_recruiter_submission(event: Dict) -> Dict:
         cv_download_url = None
 
         if jd_key:
-            try:
-                s3.head_object(Bucket=BUCKET_NAME, Key=jd_key)
-                jd_download_url = s3.generate_presigned_url(
-                    ClientMethod='get_object',
-                    Params={"Bucket": BUCKET_NAME, "Key": jd_key},
-                    ExpiresIn=DOWNLOAD_URL_EXPIRY
-                )
-            except ClientError:
-                logger.warning(f"JD not found for {rec_id}: {jd_key}")
+            if jd_key in existing_keys:
+                jd_download_url = _presign_get(jd_key, DOWNLOAD_URL_EXPIRY)
+            else:
+                logger.warning("JD not found for %s: %s", rec_id, jd_key)
 
         if cv_key:
-            try:
-                s3.head_object(Bucket=BUCKET_NAME, Key=cv_key)
-                cv_download_url = s3.generate_presigned_url(
-                    ClientMethod='get_object',
-                    Params={"Bucket": BUCKET_NAME, "Key": cv_key},
-                    ExpiresIn=DOWNLOAD_URL_EXPIRY
-                )
-            except ClientError:
-                logger.warning(f"Custom CV not found for {rec_id}: {cv_key}")
+            if cv_key in existing_keys:
+                cv_download_url = _presign_get(cv_key, DOWNLOAD_URL_EXPIRY)
+            else:
+                logger.warning("Custom CV not found for %s: %s", rec_id, cv_key)
 
         meta["jd_download_url"] = jd_download_url
         meta["cv_download_url"] = cv_download_url
@@ -1182,9 +1590,9 @@ def get_recruiter_submission(event: Dict) -> Dict:
         # Sanitize response for non-admin users
         if not user_is_admin:
             meta = sanitize_submission_for_recruiter(meta)
-            logger.info(f"Retrieved recruiter submission (sanitized): {rec_id}")
+            logger.info("Retrieved recruiter submission (sanitized): %s", rec_id)
         else:
-            logger.info(f"Retrieved recruiter submission (full): {rec_id}")
+            logger.info("Retrieved recruiter submission (full): %s", rec_id)
 
         return _response(200, meta, event=event)
 
@@ -1197,6 +1605,46 @@ def get_recruiter_submission(event: Dict) -> Dict:
         return _error_response(500, "An unexpected error occurred", "InternalError", event=event, internal_error=str(e))
 
 
+def _update_submission_meta(rec_id: str, apply: Callable[[Dict], bool]) -> Optional[Dict]:
+    """
+    Read-modify-write a submission meta.json with an If-Match conditional PUT,
+    re-reading and re-applying the change when a concurrent write wins.
+    apply() returns False when nothing changed, which skips the write.
+    Returns the (possibly unchanged) meta, or None if the submission doesn't exist.
+    Raises ClientError (a write conflict once META_UPDATE_ATTEMPTS are used up).
+    """
+    meta_key = f"{_rec_prefix(rec_id)}meta.json"
+
+    for attempt in range(1, META_UPDATE_ATTEMPTS + 1):
+        try:
+            obj = _s3().get_object(Bucket=BUCKET_NAME, Key=meta_key)
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'NoSuchKey':
+                return None
+            raise
+
+        meta = _json_loads(obj['Body'].read())
+        if not apply(meta):
+            return meta
+
+        try:
+            _s3().put_object(
+                Bucket=BUCKET_NAME,
+                Key=meta_key,
+                Body=_json_dumps(meta),
+                ContentType="application/json",
+                IfMatch=obj['ETag']
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] in WRITE_CONFLICT_CODES and attempt < META_UPDATE_ATTEMPTS:
+                logger.info("Concurrent update of %s, retrying (attempt %s)", meta_key, attempt)
+                continue
+            raise
+
+        _index_put_submission(meta)
+        return meta
+
+
 def update_recruiter_status(event: Dict) -> Dict:
     """
     PUT /recruiter-submissions/{id}/status
@@ -1209,59 +1657,47 @@ def update_recruiter_status(event: Dict) -> Dict:
         if not rec_id:
             return _error_response(400, "Missing submission ID", "InvalidRequest")
 
-        body = json.loads(event.get('body') or '{}')
+        body = _parse_body(event)
         new_status = body.get('status')
         contact_note = body.get('note', '')
 
         if not new_status:
             return _error_response(400, "Missing status field", "InvalidRequest")
 
-        # Get existing metadata
-        prefix = _rec_prefix(rec_id)
-        meta_key = f"{prefix}meta.json"
-
-        try:
-            obj = s3.get_object(Bucket=BUCKET_NAME, Key=meta_key)
-            meta = json.loads(obj['Body'].read().decode('utf-8'))
-        except ClientError as e:
-            if e.response['Error']['Code'] == 'NoSuchKey':
-                return _error_response(404, f"Submission not found: {rec_id}", "NotFound")
-            raise
-
-        # Update status
-        old_status = meta.get('status')
-        meta['status'] = new_status
-        meta['updated_at'] = _utc_now()
-
-        # Add to contact history if status changed
-        if old_status != new_status:
-            if 'contact_history' not in meta:
-                meta['contact_history'] = []
-
-            meta['contact_history'].append({
-                "date": _utc_now(),
+        valid, error = validate_status(new_status)
+        if not valid:
+            return _error_response(400, error, "ValidationError")
+
+        # One timestamp for updated_at and the contact history entry
+        now = _utc_now()
+        previous = {}
+
+        def apply_status(meta: Dict) -> bool:
+            old_status = previous['status'] = meta.get('status')
+            if old_status == new_status:
+                return False
+            meta['status'] = new_status
+            meta['updated_at'] = now
+
+            # Add to contact history
+            meta.setdefault('contact_history', []).append({
+                "date": now,
                 "old_status": old_status,
                 "new_status": new_status,
                 "note": contact_note
             })
+            return True
 
-        # Save updated metadata
-        s3.put_object(
-            Bucket=BUCKET_NAME,
-            Key=meta_key,
-            Body=json.dumps(meta, ensure_ascii=False, indent=2).encode('utf-8'),
-            ContentType="application/json",
-            Metadata={
-                'submission-id': rec_id,
-                'updated-at': meta['updated_at']
-            }
-        )
+        meta = _update_submission_meta(rec_id, apply_status)
+        if meta is None:
+            return _error_response(404, f"Submission not found: {rec_id}", "NotFound")
+        old_status = previous['status']
 
-        logger.info(f"Updated status for {rec_id}: {old_status} -> {new_status}")
+        logger.info("Updated status for %s: %s -> %s", rec_id, old_status, new_status)
 
         return _response(200, {
             "submission_id": rec_id,
-            "updated": True,
+            "updated": old_status != new_status,
             "old_status": old_status,
             "new_status": new_status,
             "updated_at": meta['updated_at']
@@ -1272,6 +1708,8 @@ def update_recruiter_status(event: Dict) -> Dict:
     except ValueError as e:
         return _error_response(400, str(e), "InvalidRequest")
     except ClientError as e:
+        if e.response['Error']['Code'] in WRITE_CONFLICT_CODES:
+            return _error_response(409, f"Submission was modified concurrently, retry the update: {rec_id}", "Conflict", event=event)
         return _error_response(500, "Storage operation failed", "StorageError", event=event, internal_error=str(e))
     except Exception as e:
         logger.exception("Unexpected error in update_recruiter_status")
@@ -1290,38 +1728,28 @@ def update_recruiter_notes(event: Dict) -> Dict:
         if not rec_id:
             return _error_response(400, "Missing submission ID", "InvalidRequest")
 
-        body = json.loads(event.get('body') or '{}')
+        body = _parse_body(event)
         notes = body.get('notes', '')
+        now = _utc_now()
+        previous = {}
 
-        # Get existing metadata
-        prefix = _rec_prefix(rec_id)
-        meta_key = f"{prefix}meta.json"
-
-        try:
-            obj = s3.get_object(Bucket=BUCKET_NAME, Key=meta_key)
-            meta = json.loads(obj['Body'].read().decode('utf-8'))
-        except ClientError as e:
-            if e.response['Error']['Code'] == 'NoSuchKey':
-                return _error_response(404, f"Submission not found: {rec_id}", "NotFound")
-            raise
-
-        # Update notes
-        meta['admin_notes'] = notes
-        meta['updated_at'] = _utc_now()
+        def apply_notes(meta: Dict) -> bool:
+            previous['notes'] = meta.get('admin_notes')
+            if previous['notes'] == notes:
+                return False
+            meta['admin_notes'] = notes
+            meta['updated_at'] = now
+            return True
 
-        # Save updated metadata
-        s3.put_object(
-            Bucket=BUCKET_NAME,
-            Key=meta_key,
-            Body=json.dumps(meta, ensure_ascii=False, indent=2).encode('utf-8'),
-            ContentType="application/json"
-        )
+        meta = _update_submission_meta(rec_id, apply_notes)
+        if meta is None:
+            return _error_response(404, f"Submission not found: {rec_id}", "NotFound")
 
-        logger.info(f"Updated notes for {rec_id}")
+        logger.info("Updated notes for %s", rec_id)
 
         return _response(200, {
             "submission_id": rec_id,
-            "updated": True,
+            "updated": previous['notes'] != notes,
             "updated_at": meta['updated_at']
         })
 
@@ -1330,6 +1758,8 @@ def update_recruiter_notes(event: Dict) -> Dict:
     except ValueError as e:
         return _error_response(400, str(e), "InvalidRequest")
     except ClientError as e:
+        if e.response['Error']['Code'] in WRITE_CONFLICT_CODES:
+            return _error_response(409, f"Submission was modified concurrently, retry the update: {rec_id}", "Conflict", event=event)
         return _error_response(500, "Storage operation failed", "StorageError", event=event, internal_error=str(e))
     except Exception as e:
         logger.exception("Unexpected error in update_recruiter_notes")
@@ -1348,42 +1778,25 @@ def upload_custom_cv(event: Dict) -> Dict:
         if not rec_id:
             return _error_response(400, "Missing submission ID", "InvalidRequest")
 
-        # Verify submission exists
-        prefix = _rec_prefix(rec_id)
-        meta_key = f"{prefix}meta.json"
-
-        try:
-            obj = s3.get_object(Bucket=BUCKET_NAME, Key=meta_key)
-            meta = json.loads(obj['Body'].read().decode('utf-8'))
-        except ClientError as e:
-            if e.response['Error']['Code'] == 'NoSuchKey':
-                return _error_response(404, f"Submission not found: {rec_id}", "NotFound")
-            raise
+        cv_key = f"{_rec_prefix(rec_id)}cv_custom.pdf"
+        now = _utc_now()
 
-        # Generate presigned URL for custom CV upload
-        cv_key = f"{prefix}cv_custom.pdf"
-        cv_upload_url = s3.generate_presigned_url(
-            ClientMethod='put_object',
-            Params={
-                "Bucket": BUCKET_NAME,
-                "Key": cv_key,
-                "ContentType": "application/pdf"
-            },
-            ExpiresIn=PRESIGNED_URL_EXPIRY
-        )
+        def apply_cv_key(meta: Dict) -> bool:
+            if meta['files'].get('customized_cv') == cv_key:
+                return False  # Re-upload to the same key
+            meta['files']['customized_cv'] = cv_key
+            meta['updated_at'] = now
+            return True
 
-        # Update metadata with CV key
-        meta['files']['customized_cv'] = cv_key
-        meta['updated_at'] = _utc_now()
+        # Record the CV key (also verifies the submission exists)
+        meta = _update_submission_meta(rec_id, apply_cv_key)
+        if meta is None:
+            return _error_response(404, f"Submission not found: {rec_id}", "NotFound")
 
-        s3.put_object(
-            Bucket=BUCKET_NAME,
-            Key=meta_key,
-            Body=json.dumps(meta, ensure_ascii=False, indent=2).encode('utf-8'),
-            ContentType="application/json"
-        )
+        # Generate presigned URL for custom CV upload
+        cv_upload_url = _presign_put(cv_key, PRESIGNED_URL_EXPIRY)
 
-        logger.info(f"Generated custom CV upload URL for: {rec_id}")
+        logger.info("Generated custom CV upload URL for: %s", rec_id)
 
         return _response(200, {
             "submission_id": rec_id,
@@ -1396,6 +1809,8 @@ def upload_custom_cv(event: Dict) -> Dict:
     except ValueError as e:
         return _error_response(400, str(e), "InvalidRequest")
     except ClientError as e:
+        if e.response['Error']['Code'] in WRITE_CONFLICT_CODES:
+            return _error_response(409, f"Submission was modified concurrently, retry the update: {rec_id}", "Conflict", event=event)
         return _error_response(500, "Storage operation failed", "StorageError", event=event, internal_error=str(e))
     except Exception as e:
         logger.exception("Unexpected error in upload_custom_cv")
@@ -1416,10 +1831,11 @@ def send_email_manually(event: Dict) -> Dict:
             return _error_response(400, "Missing submission ID", "InvalidRequest")
 
         # Check if Email is available
-        if not EMAIL_AVAILABLE:
+        notifier = _email_ses()
+        if not notifier:
             return _error_response(503, "Email module not available", "ServiceUnavailable")
 
-        if not is_ses_enabled():
+        if not notifier.is_ses_enabled():
             return _error_response(503, "Email SES not configured", "ServiceUnavailable")
 
         # Fetch submission metadata from S3
@@ -1427,8 +1843,8 @@ def send_email_manually(event: Dict) -> Dict:
         meta_key = f"{prefix}meta.json"
 
         try:
-            obj = s3.get_object(Bucket=BUCKET_NAME, Key=meta_key)
-            meta = json.loads(obj['Body'].read().decode('utf-8'))
+            obj = _s3().get_object(Bucket=BUCKET_NAME, Key=meta_key)
+            meta = _json_loads(obj['Body'].read())
         except ClientError as e:
             if e.response['Error']['Code'] == 'NoSuchKey':
                 return _error_response(404, f"Submission not found: {rec_id}", "NotFound")
@@ -1447,15 +1863,12 @@ def send_email_manually(event: Dict) -> Dict:
                 'key': meta['files']['customized_cv']
             }
 
-        success, message = send_email_notification(meta, cv_info=cv_info)
-
-        # Initialize email_history if not present
-        if 'email_history' not in meta:
-            meta['email_history'] = []
+        success, message = notifier.send_application_notification(meta, cv_info=cv_info)
 
-        # Add to email history
+        # Add to email history (same timestamp as updated_at)
+        now = _utc_now()
         history_entry = {
-            'sent_at': _utc_now(),
+            'sent_at': now,
             'sent_by': user_email,
             'trigger': 'manual'
         }
@@ -1463,22 +1876,20 @@ def send_email_manually(event: Dict) -> Dict:
         if success:
             history_entry['status'] = 'sent'
             history_entry['message_id'] = message
-            logger.info(f"Manual email notification sent for {rec_id}: {message}")
+            logger.info("Manual email notification sent for %s: %s", rec_id, message)
         else:
             history_entry['status'] = 'failed'
             history_entry['error'] = message
-            logger.warning(f"Manual email notification failed for {rec_id}: {message}")
+            logger.warning("Manual email notification failed for %s: %s", rec_id, message)
 
-        meta['email_history'].append(history_entry)
+        def append_history(current: Dict) -> bool:
+            current.setdefault('email_history', []).append(history_entry)
+            current['updated_at'] = now
+            return True
 
-        # Update metadata with history
-        meta['updated_at'] = _utc_now()
-        s3.put_object(
-            Bucket=BUCKET_NAME,
-            Key=meta_key,
-            Body=json.dumps(meta, ensure_ascii=False, indent=2).encode('utf-8'),
-            ContentType="application/json"
-        )
+        # Conditional append, so a concurrent status/notes update isn't overwritten
+        if _update_submission_meta(rec_id, append_history) is None:
+            return _error_response(404, f"Submission not found: {rec_id}", "NotFound")
 
         # Return response
         if success:
@@ -1501,19 +1912,77 @@ def send_email_manually(event: Dict) -> Dict:
     except ValueError as e:
         return _error_response(400, str(e), "InvalidRequest")
     except ClientError as e:
+        if e.response['Error']['Code'] in WRITE_CONFLICT_CODES:
+            return _error_response(409, f"Submission was modified concurrently, retry the update: {rec_id}", "Conflict", event=event)
         return _error_response(500, "Storage operation failed", "StorageError", event=event, internal_error=str(e))
     except Exception as e:
         logger.exception("Unexpected error in send_email_manually")
         return _error_response(500, "An unexpected error occurred", "InternalError", event=event, internal_error=str(e))
 
 
+@lru_cache(maxsize=8)
+def _stage_prefix(stage: str) -> str:
+    """Path prefix added by a named API Gateway stage ('' for $default)"""
+    if not stage or stage == '$default':
+        return ''
+    return f'/{stage}'
+
+
+# Route access levels: public routes skip authentication, admin routes
+# require a valid token with the admin role
+ACCESS_PUBLIC = 'public'
+ACCESS_ADMIN = 'admin'
+
+# Route table: (method, compiled path pattern, handler, access), matched in order
+ROUTES = [
+    # ========== RECRUITER SUBMISSION ENDPOINTS ==========
+    ('POST', re.compile(r'/recruiter-submissions'), create_recruiter_submission, ACCESS_PUBLIC),
+    ('GET', re.compile(r'/recruiter-submissions'), list_recruiter_submissions, ACCESS_ADMIN),
+    ('GET', re.compile(r'/recruiter-submissions/[^/]+'), get_recruiter_submission, ACCESS_ADMIN),
+    ('PUT', re.compile(r'/recruiter-submissions/[^/]+/status'), update_recruiter_status, ACCESS_ADMIN),
+    ('PUT', re.compile(r'/recruiter-submissions/[^/]+/notes'), update_recruiter_notes, ACCESS_ADMIN),
+    ('POST', re.compile(r'/recruiter-submissions/[^/]+/cv-upload'), upload_custom_cv, ACCESS_ADMIN),
+    ('POST', re.compile(r'/recruiter-submissions/[^/]+/send-email'), send_email_manually, ACCESS_ADMIN),
+
+    # ========== JOB APPLICATION ENDPOINTS ==========
+    ('POST', re.compile(r'/applications'), create_application, ACCESS_ADMIN),
+    ('GET', re.compile(r'/applications'), list_applications, ACCESS_ADMIN),
+    ('GET', re.compile(r'/applications/[^/]+'), get_application, ACCESS_ADMIN),
+    ('PUT', re.compile(r'/applications/[^/]+'), update_application, ACCESS_ADMIN),
+    ('DELETE', re.compile(r'/applications/[^/]+'), delete_application, ACCESS_ADMIN),
+    ('POST', re.compile(r'/applications/[^/]+/cv-upload-url'), get_cv_upload_url, ACCESS_ADMIN),
+]
+
+# Routes grouped by method so a request only tries patterns for its own method
+ROUTES_BY_METHOD: Dict[str, List[Tuple[re.Pattern, Any, str]]] = defaultdict(list)
+for _method, _pattern, _handler, _access in ROUTES:
+    ROUTES_BY_METHOD[_method].append((_pattern, _handler, _access))
+del _method, _pattern, _handler, _access
+
+
+def _match_route(method: str, path: str) -> Optional[Tuple[Any, str]]:
+    """(handler, access) for a request, or None if no route matches"""
+    for pattern, handler, access in ROUTES_BY_METHOD.get(method, ()):
+        if pattern.fullmatch(path):
+            return handler, access
+    return None
+
+
 def lambda_handler(event: Dict, context: Any) -> Dict:
     """
     Main Lambda handler with authentication and security controls
     Routes requests to appropriate function
     """
-    # Sanitize event for logging (remove PII and tokens)
-    logger.info(f"Event: {json.dumps(sanitize_event_for_logging(event))}")
+    # Sanitize event for logging (remove PII and tokens); only serialized at DEBUG
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Event: %s", json.dumps(sanitize_event_for_logging(event)))
+
+    # Direct invocation (aws lambda invoke); API Gateway events never carry 'action'
+    # 'rebuild-application-index' is the name from before submissions were indexed
+    if event.get('action') in ('rebuild-index', 'rebuild-application-index'):
+        return rebuild_index()
+    if event.get('action') == 'send-submission-email':
+        return send_submission_email(event.get('submission_id', ''))
 
     # Handle OPTIONS preflight requests
     method = event.get('requestContext', {}).get('http', {}).get('method') or event.get('httpMethod')
@@ -1525,129 +1994,71 @@ def lambda_handler(event: Dict, context: Any) -> Dict:
     path = path.rstrip('/')
 
     # Strip stage name from path (e.g., /prod/applications -> /applications)
-    stage = event.get('requestContext', {}).get('stage', '')
-    if stage and path.startswith(f'/{stage}'):
-        path = path[len(stage) + 1:]  # Remove /stage prefix
-        if not path:
-            path = '/'
+    stage_prefix = _stage_prefix(event.get('requestContext', {}).get('stage', ''))
+    if stage_prefix:
+        path = path.removeprefix(stage_prefix) or '/'
 
     # Get client IP for rate limiting
     client_ip = event.get('requestContext', {}).get('http', {}).get('sourceIp', '')
-    logger.info(f"Request: {method} {path} from {client_ip}")
+    logger.info("Request: %s %s from %s", method, path, client_ip)
+
+    # Reject oversized bodies before any handler parses them
+    if _body_too_large(event):
+        return _error_response(413, f"Request body exceeds {MAX_BODY_BYTES} bytes", "PayloadTooLarge", event=event)
+
+    route = _match_route(method, path)
+    access = route[1] if route else None
 
     # Rate limiting for public submission endpoint
-    if method == 'POST' and path == '/recruiter-submissions':
+    if access == ACCESS_PUBLIC:
         allowed, error = check_rate_limit(client_ip, limit=5, window=300)  # 5 per 5 minutes
         if not allowed:
             return _error_response(429, error, "RateLimitExceeded", event=event)
 
     # Authentication and Authorization
     # Public endpoint: POST /recruiter-submissions (recruiter form submission)
-    # All other endpoints require authentication
-    user = None
-    requires_auth = not (method == 'POST' and path == '/recruiter-submissions')
-
-    if requires_auth:
+    # All other endpoints, including unknown paths, require authentication
+    if access != ACCESS_PUBLIC:
         try:
             user = validate_token(event)
             event['user'] = user  # Add user context to event
-            logger.info(f"Authenticated user: {user.get('email', user.get('sub'))}")
+            logger.info("Authenticated user: %s", user.get('email', user.get('sub')))
         except Exception as e:
-            logger.warning(f"Authentication failed: {str(e)}")
+            logger.warning("Authentication failed: %s", e)
             return _error_response(401, str(e), "Unauthorized", event=event)
 
-    # Check if user is admin for admin-only endpoints
-    admin_endpoints = [
-        ('/recruiter-submissions', 'GET'),  # List all submissions
-        ('/recruiter-submissions/', 'GET'),  # Get submission details (starts with)
-        ('/status', 'PUT'),  # Update status (ends with)
-        ('/notes', 'PUT'),  # Update notes (ends with)
-        ('/cv-upload', 'POST'),  # Upload CV (ends with)
-        ('/send-email', 'POST'),  # Send email notification (ends with)
-        ('/applications', 'GET'),  # List applications
-        ('/applications', 'POST'),  # Create application
-        ('/applications/', 'GET'),  # Get application (starts with)
-        ('/applications/', 'PUT'),  # Update application (starts with)
-        ('/applications/', 'DELETE'),  # Delete application (starts with)
-        ('/cv-upload-url', 'POST')  # CV upload URL (ends with)
-    ]
+        # Check if user is admin for admin-only endpoints
+        if access == ACCESS_ADMIN and not is_admin(user):
+            logger.warning("Access denied for non-admin user: %s", user.get('email', user.get('sub')))
+            return _error_response(403, "Admin access required", "Forbidden", event=event)
 
-    is_admin_endpoint = False
-    for endpoint_path, endpoint_method in admin_endpoints:
-        if endpoint_method == method:
-            if endpoint_path.endswith('/') and path.startswith(endpoint_path):
-                is_admin_endpoint = True
-                break
-            elif path.endswith(endpoint_path):
-                is_admin_endpoint = True
-                break
-            elif path == endpoint_path:
-                is_admin_endpoint = True
-                break
-
-    if is_admin_endpoint and user and not is_admin(user):
-        logger.warning(f"Access denied for non-admin user: {user.get('email', user.get('sub'))}")
-        return _error_response(403, "Admin access required", "Forbidden", event=event)
+    if route is None:
+        return _error_response(404, f"Endpoint not found: {method} {path}", "NotFound")
 
     # Route to appropriate handler
     try:
-        # ========== RECRUITER SUBMISSION ENDPOINTS ==========
-        # POST /recruiter-submissions - Create submission
-        if method == 'POST' and path == '/recruiter-submissions':
-            return create_recruiter_submission(event)
-
-        # GET /recruiter-submissions - List all submissions
-        elif method == 'GET' and path == '/recruiter-submissions':
-            return list_recruiter_submissions(event)
-
-        # GET /recruiter-submissions/{id} - Get one submission
-        elif method == 'GET' and path.startswith('/recruiter-submissions/') and not path.endswith(('/status', '/notes', '/cv-upload')):
-            return get_recruiter_submission(event)
-
-        # PUT /recruiter-submissions/{id}/status - Update status
-        elif method == 'PUT' and path.endswith('/status'):
-            return update_recruiter_status(event)
-
-        # PUT /recruiter-submissions/{id}/notes - Update notes
-        elif method == 'PUT' and path.endswith('/notes'):
-            return update_recruiter_notes(event)
-
-        # POST /recruiter-submissions/{id}/cv-upload - Upload custom CV
-        elif method == 'POST' and path.startswith('/recruiter-submissions/') and path.endswith('/cv-upload'):
-            return upload_custom_cv(event)
-
-        # POST /recruiter-submissions/{id}/send-email - Send email notification
-        elif method == 'POST' and path.startswith('/recruiter-submissions/') and path.endswith('/send-email'):
-            return send_email_manually(event)
-
-        # ========== JOB APPLICATION ENDPOINTS ==========
-        # POST /applications - Create
-        elif method == 'POST' and path == '/applications':
-            return create_application(event)
+        return route[0](event)
 
-        # GET /applications - List
-        elif method == 'GET' and path == '/applications':
-            return list_applications(event)
-
-        # GET /applications/{id} - Get one
-        elif method == 'GET' and path.startswith('/applications/') and not path.endswith('/cv-upload-url'):
-            return get_application(event)
-
-        # PUT /applications/{id} - Update
-        elif method == 'PUT' and path.startswith('/applications/'):
-            return update_application(event)
+    except Exception as e:
+        logger.exception("Unexpected error in lambda_handler")
+        return _error_response(500, f"Internal server error: {str(e)}", "InternalError")
 
-        # DELETE /applications/{id} - Delete
-        elif method == 'DELETE' and path.startswith('/applications/'):
-            return delete_application(event)
 
-        # POST /applications/{id}/cv-upload-url - Get upload URL
-        elif method == 'POST' and path.endswith('/cv-upload-url'):
-            return get_cv_upload_url(event)
+def _warm_connections() -> None:
+    """Load client models, open the S3 connection and fetch the Cognito key set ahead of the first request"""
+    try:
+        _s3().head_bucket(Bucket=BUCKET_NAME)
+        # Presigning is local but lazily builds the signer and endpoint resolver
+        _presign_get("__warmup__", 60)
+        if USE_DYNAMODB:
+            _dynamodb()
+        _jwks_client(COGNITO_ISSUER).get_jwk_set()
+    except Exception as e:
+        logger.warning("Connection warm-up failed: %s", e)
 
-        else:
-            return _error_response(404, f"Endpoint not found: {method} {path}", "NotFound")
 
-    except Exception as e:
-        logger.exception("Unexpected error in lambda_handler")
-        return _error_response(500, f"Internal server error: {str(e)}", "InternalError")
+# Provisioned-concurrency environments are initialized before traffic
+# arrives, so pay for the client and the first handshake there. On-demand
+# cold starts stay lazy so preflights don't wait on S3.
+if os.environ.get('AWS_LAMBDA_INITIALIZATION_TYPE') == 'provisioned-concurrency':
+    _warm_connections()
@@ -3,19 +3,38 @@ Amazon SES Email Notification Module
 Sends job application notifications via AWS SES
 """
 
-import json
 import os
 import logging
 from html import escape as html_escape
 from typing import Dict, Any, Optional, Tuple
-import boto3
 from botocore.exceptions import ClientError
 
 logger = logging.getLogger()
 logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO'))
 
-# AWS SES client (must use ap-southeast-1 since SES not available in ap-southeast-5)
-ses = boto3.client('ses', region_name=os.environ.get('SES_REGION', 'ap-southeast-1'))
+# AWS SES client, created on first send (must use ap-southeast-1 since SES
+# not available in ap-southeast-5)
+ses = None
+
+
+def _ses():
+    """Get the shared SES client, creating it on first use"""
+    global ses
+    if ses is None:
+        import boto3
+        from botocore.config import Config
+        ses = boto3.client(
+            'ses',
+            region_name=os.environ.get('SES_REGION', 'ap-southeast-1'),
+            config=Config(
+                tcp_keepalive=True,  # Reuse the cross-region TLS connection across warm invocations
+                max_pool_connections=10,
+                connect_timeout=2,
+                read_timeout=10,
+                retries={'max_attempts': 3, 'mode': 'standard'}
+            )
+        )
+    return ses
 
 # Configuration from environment variables
 SES_SENDER_EMAIL = os.environ.get('SES_SENDER_EMAIL', '')
@@ -23,84 +42,18 @@ SES_RECIPIENT_EMAIL = os.environ.get('SES_RECIPIENT_EMAIL', '')
 SES_REPLY_TO = os.environ.get('SES_REPLY_TO', '')
 SES_CHARSET = 'UTF-8'
 
+# Configuration is fixed for the life of the container, so check it once
+SES_ENABLED = bool(SES_SENDER_EMAIL and SES_RECIPIENT_EMAIL)
+if not SES_SENDER_EMAIL:
+    logger.warning("SES_SENDER_EMAIL not configured")
+if not SES_RECIPIENT_EMAIL:
+    logger.warning("SES_RECIPIENT_EMAIL not configured")
 
-def is_ses_enabled() -> bool:
-    """
-    Check if SES email notifications are configured
-
-    Returns:
-        True if all required config is present, False otherwise
-    """
-    if not SES_SENDER_EMAIL:
-        logger.warning("SES_SENDER_EMAIL not configured")
-        return False
-    if not SES_RECIPIENT_EMAIL:
-        logger.warning("SES_RECIPIENT_EMAIL not configured")
-        return False
-    return True
-
-
-def format_application_email(submission: Dict[str, Any]) -> Tuple[str, str, str]:
-    """
-    Format job application data into email (HTML and plain text)
-
-    Args:
-        submission: Job application submission data
-
-    Returns:
-        Tuple of (subject, html_body, text_body)
-    """
-    recruiter = submission.get('recruiter', {})
-    job = submission.get('job', {})
-    submission_id = submission.get('submission_id', 'Unknown')
-    created_at = submission.get('created_at', 'Unknown')
-
-    # Escape all user-controlled data for HTML injection prevention
-    # Recruiter data
-    recruiter_name = html_escape(recruiter.get('name', 'N/A'))
-    recruiter_email = html_escape(recruiter.get('email', 'N/A'))
-    recruiter_email_raw = recruiter.get('email', '')  # For mailto: href
-    recruiter_phone = html_escape(recruiter.get('phone', 'N/A'))
-    recruiter_phone_raw = recruiter.get('phone', '')  # For tel: href
-    recruiter_agency = html_escape(recruiter.get('agency', '')) if recruiter.get('agency') else ''
-
-    # Job data
-    job_title = html_escape(job.get('title', 'N/A'))
-    company = html_escape(job.get('company', 'N/A'))
-    requirements = html_escape(job.get('requirements', 'N/A'))
-    description = html_escape(job.get('description', 'N/A'))
-
-    # Escape submission metadata
-    submission_id_safe = html_escape(submission_id)
-    created_at_safe = html_escape(created_at)
-
-    # Build subject line (for email subject, basic escaping is sufficient)
-    subject = f"New Job Application: {job_title} at {company} - {submission_id_safe}"
-
-    # Build salary range string (numbers are safe, but escape currency code)
-    salary_min = job.get('salary_min', 0)
-    salary_max = job.get('salary_max', 0)
-    currency = html_escape(job.get('currency', 'MYR'))
-
-    if salary_min > 0 and salary_max > 0:
-        salary_str = f"{currency} {salary_min:,} - {salary_max:,}"
-    elif salary_min > 0:
-        salary_str = f"{currency} {salary_min:,}+"
-    else:
-        salary_str = "Not specified"
-
-    # Build skills list with HTML escaping
-    skills = job.get('skills', [])
-    if skills:
-        escaped_skills = [html_escape(str(skill)) for skill in skills[:10]]
-        skills_str = ', '.join(escaped_skills)
-        if len(skills) > 10:
-            skills_str += f" (+{len(skills) - 10} more)"
-    else:
-        skills_str = "Not specified"
 
-    # HTML email body
-    html_body = f"""<!DOCTYPE html>
+# Email templates, built once at import and filled with str.format_map per
+# message. All values are HTML-escaped before formatting; optional sections
+# are rendered from their own fragments (or left empty)
+_HTML_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -137,7 +90,7 @@ def format_application_email(submission: Dict[str, Any]) -> Tuple[str, str, str]
                                     <td style="color: #7f8c8d;"><strong>Phone:</strong></td>
                                     <td style="color: #2c3e50;"><a href="tel:{recruiter_phone_raw}" style="color: #3498db; text-decoration: none;">{recruiter_phone}</a></td>
                                 </tr>
-                                {f'<tr><td style="color: #7f8c8d;"><strong>Agency:</strong></td><td style="color: #2c3e50;">{recruiter_agency}</td></tr>' if recruiter_agency else ''}
+                                {agency_row}
                             </table>
 
                             <!-- Job Details -->
@@ -161,15 +114,9 @@ def format_application_email(submission: Dict[str, Any]) -> Tuple[str, str, str]
                                 </tr>
                             </table>
 
-                            {f'''<!-- Requirements -->
-                            <h2 style="color: #2c3e50; font-size: 18px; margin: 0 0 15px 0; border-bottom: 2px solid #ecf0f1; padding-bottom: 10px;">📋 Requirements</h2>
-                            <p style="color: #34495e; line-height: 1.6; background-color: #f8f9fa; padding: 15px; border-radius: 4px; margin-bottom: 25px;">{requirements}</p>
-                            ''' if job.get('requirements') else ''}
+                            {requirements_block}
 
-                            {f'''<!-- Description -->
-                            <h2 style="color: #2c3e50; font-size: 18px; margin: 0 0 15px 0; border-bottom: 2px solid #ecf0f1; padding-bottom: 10px;">📝 Description</h2>
-                            <p style="color: #34495e; line-height: 1.6; background-color: #f8f9fa; padding: 15px; border-radius: 4px; margin-bottom: 25px;">{description}</p>
-                            ''' if job.get('description') else ''}
+                            {description_block}
 
                             <!-- Action Button -->
                             <div style="text-align: center; margin: 30px 0;">
@@ -193,18 +140,28 @@ def format_application_email(submission: Dict[str, Any]) -> Tuple[str, str, str]
 </body>
 </html>"""
 
-    # Plain text email body (fallback)
-    # Note: Text email is less vulnerable to injection, but we use escaped values for consistency
-    text_body = f"""
+_HTML_AGENCY_ROW = '<tr><td style="color: #7f8c8d;"><strong>Agency:</strong></td><td style="color: #2c3e50;">{recruiter_agency}</td></tr>'
+
+_HTML_REQUIREMENTS_BLOCK = """<!-- Requirements -->
+                            <h2 style="color: #2c3e50; font-size: 18px; margin: 0 0 15px 0; border-bottom: 2px solid #ecf0f1; padding-bottom: 10px;">📋 Requirements</h2>
+                            <p style="color: #34495e; line-height: 1.6; background-color: #f8f9fa; padding: 15px; border-radius: 4px; margin-bottom: 25px;">{requirements}</p>
+                            """
+
+_HTML_DESCRIPTION_BLOCK = """<!-- Description -->
+                            <h2 style="color: #2c3e50; font-size: 18px; margin: 0 0 15px 0; border-bottom: 2px solid #ecf0f1; padding-bottom: 10px;">📝 Description</h2>
+                            <p style="color: #34495e; line-height: 1.6; background-color: #f8f9fa; padding: 15px; border-radius: 4px; margin-bottom: 25px;">{description}</p>
+                            """
+
+_TEXT_TEMPLATE = """
 NEW JOB APPLICATION
-{'=' * 60}
+{rule}
 
 RECRUITER INFORMATION:
 ----------------------
 Name:    {recruiter_name}
 Email:   {recruiter_email}
 Phone:   {recruiter_phone}
-{f"Agency:  {recruiter_agency}" if recruiter_agency else ''}
+{agency_line}
 
 JOB DETAILS:
 ------------
@@ -213,10 +170,10 @@ Company:  {company}
 Salary:   {salary_str}
 Skills:   {skills_str}
 
-{f"REQUIREMENTS:\\n{requirements}\\n" if job.get('requirements') else ''}
-{f"DESCRIPTION:\\n{description}\\n" if job.get('description') else ''}
+{requirements_section}
+{description_section}
 
-{'=' * 60}
+{rule}
 Submission ID: {submission_id_safe}
 Received:      {created_at_safe}
 
@@ -225,6 +182,99 @@ View full details: https://cv.vgnshlv.nz/recruiter-dashboard.html?highlight={sub
 Job Tracker System - cv.vgnshlv.nz
 """
 
+_TEXT_RULE = '=' * 60
+
+
+def is_ses_enabled() -> bool:
+    """
+    Check if SES email notifications are configured
+
+    Returns:
+        True if all required config is present, False otherwise
+    """
+    return SES_ENABLED
+
+
+def format_application_email(submission: Dict[str, Any]) -> Tuple[str, str, str]:
+    """
+    Format job application data into email (HTML and plain text)
+
+    Args:
+        submission: Job application submission data
+
+    Returns:
+        Tuple of (subject, html_body, text_body)
+    """
+    recruiter = submission.get('recruiter', {})
+    job = submission.get('job', {})
+    submission_id = submission.get('submission_id', 'Unknown')
+    created_at = submission.get('created_at', 'Unknown')
+
+    # Escape all user-controlled data for HTML injection prevention, in one pass
+    agency = recruiter.get('agency') or ''
+    escaped = {name: html_escape(value) for name, value in (
+        ('recruiter_name', recruiter.get('name', 'N/A')),
+        ('recruiter_email', recruiter.get('email', 'N/A')),
+        ('recruiter_phone', recruiter.get('phone', 'N/A')),
+        ('recruiter_agency', agency),
+        ('job_title', job.get('title', 'N/A')),
+        ('company', job.get('company', 'N/A')),
+        ('requirements', job.get('requirements') or ''),
+        ('description', job.get('description') or ''),
+        ('submission_id_safe', submission_id),
+        ('created_at_safe', created_at)
+    )}
+
+    # Build subject line (for email subject, basic escaping is sufficient)
+    subject = f"New Job Application: {escaped['job_title']} at {escaped['company']} - {escaped['submission_id_safe']}"
+
+    # Build salary range string (numbers are safe, but escape currency code)
+    salary_min = job.get('salary_min', 0)
+    salary_max = job.get('salary_max', 0)
+    currency = html_escape(job.get('currency', 'MYR'))
+
+    if salary_min > 0 and salary_max > 0:
+        salary_str = f"{currency} {salary_min:,} - {salary_max:,}"
+    elif salary_min > 0:
+        salary_str = f"{currency} {salary_min:,}+"
+    else:
+        salary_str = "Not specified"
+
+    # Build skills list with HTML escaping
+    skills = job.get('skills') or []
+    if not skills:
+        skills_str = "Not specified"
+    else:
+        skills_str = ', '.join(map(html_escape, map(str, skills[:10])))
+        if len(skills) > 10:
+            skills_str += f" (+{len(skills) - 10} more)"
+
+    fields = {
+        **escaped,
+        'recruiter_email_raw': recruiter.get('email', ''),  # For mailto: href
+        'recruiter_phone_raw': recruiter.get('phone', ''),  # For tel: href
+        'salary_str': salary_str,
+        'skills_str': skills_str,
+        'rule': _TEXT_RULE
+    }
+
+    # HTML email body
+    html_body = _HTML_TEMPLATE.format_map({
+        **fields,
+        'agency_row': _HTML_AGENCY_ROW.format_map(fields) if agency else '',
+        'requirements_block': _HTML_REQUIREMENTS_BLOCK.format_map(fields) if fields['requirements'] else '',
+        'description_block': _HTML_DESCRIPTION_BLOCK.format_map(fields) if fields['description'] else ''
+    })
+
+    # Plain text email body (fallback)
+    # Note: Text email is less vulnerable to injection, but we use escaped values for consistency
+    text_body = _TEXT_TEMPLATE.format_map({
+        **fields,
+        'agency_line': f"Agency:  {fields['recruiter_agency']}" if agency else '',
+        'requirements_section': f"REQUIREMENTS:\n{fields['requirements']}\n" if fields['requirements'] else '',
+        'description_section': f"DESCRIPTION:\n{fields['description']}\n" if fields['description'] else ''
+    })
+
     return subject, html_body.strip(), text_body.strip()
 
 
@@ -278,24 +328,24 @@ def send_email(
             email_params['ReplyToAddresses'] = [SES_REPLY_TO]
 
         # Send email via SES
-        response = ses.send_email(**email_params)
+        response = _ses().send_email(**email_params)
 
         message_id = response.get('MessageId', '')
-        logger.info(f"Email sent successfully via SES: {message_id}")
+        logger.info("Email sent successfully via SES: %s", message_id)
 
         if submission_id:
-            logger.info(f"Email sent for submission: {submission_id}, MessageId: {message_id}")
+            logger.info("Email sent for submission: %s, MessageId: %s", submission_id, message_id)
 
         return True, message_id
 
     except ClientError as e:
         error_code = e.response['Error']['Code']
         error_message = e.response['Error']['Message']
-        logger.error(f"SES API error {error_code}: {error_message}")
+        logger.error("SES API error %s: %s", error_code, error_message)
         return False, f"{error_code}: {error_message}"
 
     except Exception as e:
-        logger.exception(f"Unexpected error sending email via SES: {str(e)}")
+        logger.exception("Unexpected error sending email via SES: %s", e)
         return False, str(e)
 
 
@@ -331,14 +381,14 @@ def send_application_notification(
         )
 
         if success:
-            logger.info(f"Email notification sent via SES: {result}")
+            logger.info("Email notification sent via SES: %s", result)
             return True, f"Email sent: {result}"
         else:
-            logger.warning(f"Email notification failed: {result}")
+            logger.warning("Email notification failed: %s", result)
             return False, result
 
     except Exception as e:
-        logger.exception(f"Error sending email notification via SES: {str(e)}")
+        logger.exception("Error sending email notification via SES: %s", e)
         return False, str(e)
 
 
@@ -350,7 +400,7 @@ def get_send_quota() -> Dict[str, Any]:
         Dict with quota information
     """
     try:
-        response = ses.get_send_quota()
+        response = _ses().get_send_quota()
         return {
             'max_24_hour_send': response.get('Max24HourSend', 0),
             'max_send_rate': response.get('MaxSendRate', 0),
@@ -358,5 +408,5 @@ def get_send_quota() -> Dict[str, Any]:
             'remaining_sends': response.get('Max24HourSend', 0) - response.get('SentLast24Hours', 0)
         }
     except Exception as e:
-        logger.error(f"Error fetching SES quota: {str(e)}")
+        logger.error("Error fetching SES quota: %s", e)
         return {'error': str(e)}
@@ -7,34 +7,57 @@ Triggered by S3 PutObject events
 import json
 import os
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, FrozenSet, Tuple
 
 # Configure logging
 logger = logging.getLogger()
 logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO'))
 
-# AWS clients
-s3 = boto3.client('s3')
+# Fast JSON serialization (falls back to stdlib json if orjson isn't packaged)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# AWS clients (pooled keep-alive connections are reused across warm invocations)
+s3 = boto3.client(
+    's3',
+    config=Config(
+        tcp_keepalive=True,
+        max_pool_connections=10,  # One per record in an S3 notification batch
+        connect_timeout=2,
+        read_timeout=10,
+        retries={'max_attempts': 3, 'mode': 'standard'}
+    )
+)
 
 # Configuration
 MAX_CV_SIZE = 10 * 1024 * 1024  # 10MB
 MAX_JD_SIZE = 5 * 1024 * 1024   # 5MB
 
-# File type signatures (magic bytes)
+# File type signatures (magic bytes), as tuples for a single startswith()
 FILE_SIGNATURES = {
-    'pdf': [
+    'pdf': (
         b'%PDF-',  # PDF header
-    ],
-    'docx': [
+    ),
+    'docx': (
         b'PK\x03\x04',  # ZIP header (DOCX is a ZIP archive)
-    ],
-    'doc': [
+    ),
+    'doc': (
         b'\xD0\xCF\x11\xE0\xA1\xB1\x1A\xE1',  # OLE header
-    ]
+    )
 }
 
+# Application CVs: applications/{year}/{app_id}/cv.pdf
+APPLICATION_CV_KEY = re.compile(r'applications/\d{4}/app_[^/]+/cv\.pdf')
+META_UPDATE_ATTEMPTS = 3
+
 # Suspicious patterns that might indicate malware
 SUSPICIOUS_PATTERNS = [
     b'<script',
@@ -45,10 +68,32 @@ SUSPICIOUS_PATTERNS = [
     b'<%',
 ]
 
+# Byte markers the type-specific checks look for
+PDF_MARKERS = (b'/JavaScript', b'/JS', b'/Launch', b'/SubmitForm')
+DOCX_MARKERS = (b'vbaProject', b'macros/')
+TYPE_MARKERS = {'pdf': PDF_MARKERS, 'docx': DOCX_MARKERS}
+
+# A complete PDF ends with %%EOF; readers only look for it near the end
+TRAILER_SIZE = 2048
+
+# Uploads are scanned in chunks; each chunk is searched together with the tail
+# of the previous one so patterns straddling a boundary are still found
+SCAN_CHUNK_SIZE = 256 * 1024
+SCAN_OVERLAP = max(len(p) for p in SUSPICIOUS_PATTERNS + list(PDF_MARKERS + DOCX_MARKERS)) - 1
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
 
-def get_file_signature(content: bytes) -> bytes:
-    """Get first 16 bytes for signature checking"""
-    return content[:16] if len(content) >= 16 else content
+
+def _json_loads(data: Any) -> Any:
+    """Parse JSON from bytes or str"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 def validate_file_signature(content: bytes, expected_extension: str) -> Tuple[bool, str]:
@@ -65,17 +110,14 @@ def validate_file_signature(content: bytes, expected_extension: str) -> Tuple[bo
     if not content:
         return False, "Empty file"
 
-    signature = get_file_signature(content)
-
     # Get expected signatures for this extension
-    expected_sigs = FILE_SIGNATURES.get(expected_extension.lower(), [])
+    expected_sigs = FILE_SIGNATURES.get(expected_extension.lower())
     if not expected_sigs:
         return False, f"Unknown file type: {expected_extension}"
 
     # Check if content starts with any valid signature
-    for sig in expected_sigs:
-        if signature.startswith(sig):
-            return True, ""
+    if content.startswith(expected_sigs):
+        return True, ""
 
     return False, f"Invalid {expected_extension.upper()} file signature"
 
@@ -120,62 +162,144 @@ def scan_for_suspicious_content(content: bytes) -> Tuple[bool, str]:
     return True, ""
 
 
-def validate_pdf(content: bytes) -> Tuple[bool, str]:
+def validate_pdf(trailer: bytes, markers: FrozenSet[bytes]) -> Tuple[bool, str]:
     """
-    Additional PDF-specific validation
+    Additional PDF-specific validation (the %PDF- header is already checked
+    by validate_file_signature)
 
     Args:
-        content: PDF file content
+        trailer: Last TRAILER_SIZE bytes of the PDF file
+        markers: PDF_MARKERS found anywhere in the file
 
     Returns:
         Tuple of (is_valid, error_message)
     """
-    # Check for PDF header
-    if not content.startswith(b'%PDF-'):
-        return False, "Invalid PDF header"
-
     # Check for EOF marker
-    if b'%%EOF' not in content:
+    if b'%%EOF' not in trailer:
         return False, "PDF missing EOF marker (possibly corrupted)"
 
     # Check for embedded JavaScript (common in malicious PDFs)
-    if b'/JavaScript' in content or b'/JS' in content:
+    if b'/JavaScript' in markers or b'/JS' in markers:
         logger.warning("PDF contains JavaScript")
         # Don't reject, but log for manual review
 
     # Check for suspicious Actions
-    if b'/Launch' in content or b'/SubmitForm' in content:
+    if b'/Launch' in markers or b'/SubmitForm' in markers:
         logger.warning("PDF contains potentially suspicious actions")
 
     return True, ""
 
 
-def validate_docx(content: bytes) -> Tuple[bool, str]:
+def validate_docx(header: bytes, markers: FrozenSet[bytes]) -> Tuple[bool, str]:
     """
     Additional DOCX-specific validation
 
     Args:
-        content: DOCX file content
+        header: First bytes of the DOCX file
+        markers: DOCX_MARKERS found anywhere in the file
 
     Returns:
         Tuple of (is_valid, error_message)
     """
     # DOCX is a ZIP file, check ZIP signature
-    if not content.startswith(b'PK\x03\x04'):
+    if not header.startswith(b'PK\x03\x04'):
         return False, "Invalid DOCX/ZIP signature"
 
     # Check for macros (VBA) which can be dangerous
-    if b'vbaProject' in content or b'macros/' in content:
+    if b'vbaProject' in markers or b'macros/' in markers:
         return False, "DOCX contains macros (not allowed for security)"
 
     return True, ""
 
 
+class UploadScan:
+    """
+    Single streaming pass over an uploaded file, collecting everything the
+    validators need: the header and trailer bytes, the first suspicious
+    pattern and which type markers occur. Peak memory is one chunk plus a small overlap.
+    """
+
+    def __init__(self, markers: Tuple[bytes, ...] = ()):
+        self.header = b''
+        self.trailer = b''
+        self.suspicious_reason = ''
+        self.found_markers = set()
+        self._markers = markers
+        self._tail = b''
+
+    def feed(self, chunk: bytes):
+        """Scan the next chunk of the file"""
+        if len(self.header) < 16:
+            self.header = (self.header + chunk)[:16]
+        if len(chunk) >= TRAILER_SIZE:
+            self.trailer = chunk[-TRAILER_SIZE:]
+        else:
+            self.trailer = (self.trailer + chunk)[-TRAILER_SIZE:]
+
+        window = self._tail + chunk
+        if not self.suspicious_reason:
+            is_safe, reason = scan_for_suspicious_content(window)
+            if not is_safe:
+                self.suspicious_reason = reason
+        for marker in self._markers:
+            if marker not in self.found_markers and marker in window:
+                self.found_markers.add(marker)
+        self._tail = window[-SCAN_OVERLAP:]
+
+    @property
+    def markers(self) -> FrozenSet[bytes]:
+        return frozenset(self.found_markers)
+
+
+def mark_application_cv(bucket: str, key: str, uploaded: bool):
+    """
+    Record in the application's meta.json whether a valid CV is stored, so the
+    API can skip an existence probe before presigning downloads
+
+    Args:
+        bucket: S3 bucket name
+        key: Uploaded file key
+        uploaded: True once a CV passes validation, False after it is deleted
+    """
+    if not APPLICATION_CV_KEY.fullmatch(key):
+        return
+
+    meta_key = key.rsplit('/', 1)[0] + '/meta.json'
+    for _ in range(META_UPDATE_ATTEMPTS):
+        try:
+            obj = s3.get_object(Bucket=bucket, Key=meta_key)
+            meta = _json_loads(obj['Body'].read())
+            if meta.get('cv_uploaded') is uploaded:
+                return
+
+            meta['cv_uploaded'] = uploaded
+            # Conditional write so a concurrent API update is never overwritten
+            s3.put_object(
+                Bucket=bucket,
+                Key=meta_key,
+                Body=_json_dumps(meta),
+                ContentType='application/json',
+                Metadata=obj.get('Metadata', {}),
+                IfMatch=obj['ETag']
+            )
+            return
+        except ClientError as e:
+            code = e.response['Error']['Code']
+            if code in ('PreconditionFailed', 'ConditionalRequestConflict'):
+                continue  # meta.json changed underneath us, re-read and retry
+            if code != 'NoSuchKey':
+                logger.warning("Failed to update CV status in %s: %s", meta_key, e)
+            return
+
+    logger.warning("Gave up updating CV status in %s after %s attempts", meta_key, META_UPDATE_ATTEMPTS)
+
+
 def delete_invalid_file(bucket: str, key: str, reason: str):
     """Delete invalid file from S3 and log reason"""
     try:
         s3.delete_object(Bucket=bucket, Key=key)
-        logger.warning(f"Deleted invalid file {key}: {reason}")
+        logger.warning("Deleted invalid file %s: %s", key, reason)
+        mark_application_cv(bucket, key, False)
 
         # Tag the metadata file to indicate validation failure
         meta_key = key.rsplit('/', 1)[0] + '/meta.json'
@@ -195,7 +319,136 @@ def delete_invalid_file(bucket: str, key: str, reason: str):
             pass  # Metadata file might not exist yet
 
     except ClientError as e:
-        logger.error(f"Failed to delete invalid file {key}: {str(e)}")
+        logger.error("Failed to delete invalid file %s: %s", key, e)
+
+
+def _process_record(record: Dict[str, Any], request_id: str) -> Dict[str, Any]:
+    """Validate one uploaded object from an S3 event record"""
+    try:
+        # Extract S3 info
+        bucket = record['s3']['bucket']['name']
+        key = record['s3']['object']['key']
+        size = record['s3']['object']['size']
+
+        logger.info("Validating file: s3://%s/%s (%s bytes)", bucket, key, size)
+
+        # Determine file type from key
+        file_extension = key.split('.')[-1].lower()
+        if file_extension not in ['pdf', 'docx', 'doc']:
+            delete_invalid_file(bucket, key, f"Invalid extension: {file_extension}")
+            return {
+                'key': key,
+                'status': 'REJECTED',
+                'reason': f"Invalid file extension: {file_extension}"
+            }
+
+        # Check file size
+        file_type = 'cv' if 'cv' in key.lower() else 'jd'
+        valid_size, size_error = check_file_size(size, file_type)
+        if not valid_size:
+            delete_invalid_file(bucket, key, size_error)
+            return {
+                'key': key,
+                'status': 'REJECTED',
+                'reason': size_error
+            }
+
+        # Stream the file through every content check in one pass
+        scan = UploadScan(TYPE_MARKERS.get(file_extension, ()))
+        try:
+            response = s3.get_object(Bucket=bucket, Key=key)
+            chunks = response['Body'].iter_chunks(SCAN_CHUNK_SIZE)
+            scan.feed(next(chunks, b''))
+            # The magic bytes are in the first chunk; a wrong signature rejects
+            # the file without downloading the rest of it
+            valid_sig, sig_error = validate_file_signature(scan.header, file_extension)
+            if valid_sig:
+                for chunk in chunks:
+                    scan.feed(chunk)
+                    if scan.suspicious_reason:
+                        break  # Rejected regardless of the rest of the file
+            response['Body'].close()
+        except ClientError as e:
+            logger.error("Failed to download file %s: %s", key, e)
+            return {
+                'key': key,
+                'status': 'ERROR',
+                'reason': f"Download failed: {str(e)}"
+            }
+
+        # Validate file signature (magic bytes)
+        if not valid_sig:
+            delete_invalid_file(bucket, key, sig_error)
+            return {
+                'key': key,
+                'status': 'REJECTED',
+                'reason': sig_error
+            }
+
+        # Scan for suspicious content
+        suspicious_reason = scan.suspicious_reason
+        if suspicious_reason:
+            delete_invalid_file(bucket, key, f"Suspicious content: {suspicious_reason}")
+            return {
+                'key': key,
+                'status': 'REJECTED',
+                'reason': suspicious_reason
+            }
+
+        # File-type specific validation
+        if file_extension == 'pdf':
+            valid_pdf, pdf_error = validate_pdf(scan.trailer, scan.markers)
+            if not valid_pdf:
+                delete_invalid_file(bucket, key, pdf_error)
+                return {
+                    'key': key,
+                    'status': 'REJECTED',
+                    'reason': pdf_error
+                }
+
+        elif file_extension == 'docx':
+            valid_docx, docx_error = validate_docx(scan.header, scan.markers)
+            if not valid_docx:
+                delete_invalid_file(bucket, key, docx_error)
+                return {
+                    'key': key,
+                    'status': 'REJECTED',
+                    'reason': docx_error
+                }
+
+        # File passed all validations
+        logger.info("File validated successfully: %s", key)
+
+        # Tag as validated
+        try:
+            s3.put_object_tagging(
+                Bucket=bucket,
+                Key=key,
+                Tagging={
+                    'TagSet': [
+                        {'Key': 'validation_status', 'Value': 'passed'},
+                        {'Key': 'validated_at', 'Value': request_id}
+                    ]
+                }
+            )
+        except ClientError as e:
+            logger.warning("Failed to tag validated file: %s", e)
+
+        mark_application_cv(bucket, key, True)
+
+        return {
+            'key': key,
+            'status': 'ACCEPTED',
+            'reason': 'All validations passed'
+        }
+
+    except Exception as e:
+        logger.exception("Error processing record: %s", e)
+        return {
+            'key': record.get('s3', {}).get('object', {}).get('key', 'unknown'),
+            'status': 'ERROR',
+            'reason': str(e)
+        }
 
 
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
@@ -209,142 +462,34 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     Returns:
         Dict with validation results
     """
-    logger.info(f"File validation triggered: {json.dumps(event)}")
-
-    results = []
-
-    # Process each S3 record
-    for record in event.get('Records', []):
-        try:
-            # Extract S3 info
-            bucket = record['s3']['bucket']['name']
-            key = record['s3']['object']['key']
-            size = record['s3']['object']['size']
-
-            logger.info(f"Validating file: s3://{bucket}/{key} ({size} bytes)")
-
-            # Determine file type from key
-            file_extension = key.split('.')[-1].lower()
-            if file_extension not in ['pdf', 'docx', 'doc']:
-                delete_invalid_file(bucket, key, f"Invalid extension: {file_extension}")
-                results.append({
-                    'key': key,
-                    'status': 'REJECTED',
-                    'reason': f"Invalid file extension: {file_extension}"
-                })
-                continue
-
-            # Check file size
-            file_type = 'cv' if 'cv' in key.lower() else 'jd'
-            valid_size, size_error = check_file_size(size, file_type)
-            if not valid_size:
-                delete_invalid_file(bucket, key, size_error)
-                results.append({
-                    'key': key,
-                    'status': 'REJECTED',
-                    'reason': size_error
-                })
-                continue
-
-            # Download file for content validation
-            try:
-                response = s3.get_object(Bucket=bucket, Key=key)
-                content = response['Body'].read()
-            except ClientError as e:
-                logger.error(f"Failed to download file {key}: {str(e)}")
-                results.append({
-                    'key': key,
-                    'status': 'ERROR',
-                    'reason': f"Download failed: {str(e)}"
-                })
-                continue
-
-            # Validate file signature (magic bytes)
-            valid_sig, sig_error = validate_file_signature(content, file_extension)
-            if not valid_sig:
-                delete_invalid_file(bucket, key, sig_error)
-                results.append({
-                    'key': key,
-                    'status': 'REJECTED',
-                    'reason': sig_error
-                })
-                continue
-
-            # Scan for suspicious content
-            is_safe, suspicious_reason = scan_for_suspicious_content(content)
-            if not is_safe:
-                delete_invalid_file(bucket, key, f"Suspicious content: {suspicious_reason}")
-                results.append({
-                    'key': key,
-                    'status': 'REJECTED',
-                    'reason': suspicious_reason
-                })
-                continue
-
-            # File-type specific validation
-            if file_extension == 'pdf':
-                valid_pdf, pdf_error = validate_pdf(content)
-                if not valid_pdf:
-                    delete_invalid_file(bucket, key, pdf_error)
-                    results.append({
-                        'key': key,
-                        'status': 'REJECTED',
-                        'reason': pdf_error
-                    })
-                    continue
-
-            elif file_extension == 'docx':
-                valid_docx, docx_error = validate_docx(content)
-                if not valid_docx:
-                    delete_invalid_file(bucket, key, docx_error)
-                    results.append({
-                        'key': key,
-                        'status': 'REJECTED',
-                        'reason': docx_error
-                    })
-                    continue
-
-            # File passed all validations
-            logger.info(f"File validated successfully: {key}")
-
-            # Tag as validated
-            try:
-                s3.put_object_tagging(
-                    Bucket=bucket,
-                    Key=key,
-                    Tagging={
-                        'TagSet': [
-                            {'Key': 'validation_status', 'Value': 'passed'},
-                            {'Key': 'validated_at', 'Value': context.request_id}
-                        ]
-                    }
-                )
-            except ClientError as e:
-                logger.warning(f"Failed to tag validated file: {str(e)}")
-
-            results.append({
-                'key': key,
-                'status': 'ACCEPTED',
-                'reason': 'All validations passed'
-            })
-
-        except Exception as e:
-            logger.exception(f"Error processing record: {str(e)}")
-            results.append({
-                'key': record.get('s3', {}).get('object', {}).get('key', 'unknown'),
-                'status': 'ERROR',
-                'reason': str(e)
-            })
-
-    logger.info(f"Validation results: {json.dumps(results)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("File validation triggered: %s", _json_dumps(event).decode('utf-8'))
+
+    # Records are independent and each one spends its time waiting on S3, so
+    # validate them concurrently (boto3 clients are thread-safe)
+    records = event.get('Records', [])
+    request_id = context.aws_request_id
+    if len(records) > 1:
+        with ThreadPoolExecutor(max_workers=min(10, len(records))) as executor:
+            results = list(executor.map(lambda r: _process_record(r, request_id), records))
+    else:
+        results = [_process_record(r, request_id) for r in records]
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Validation results: %s", _json_dumps(results).decode('utf-8'))
+
+    # Tally outcomes in one pass
+    counts = {'ACCEPTED': 0, 'REJECTED': 0, 'ERROR': 0}
+    for result in results:
+        counts[result['status']] += 1
 
     return {
         'statusCode': 200,
-        'body': json.dumps({
+        'body': _json_dumps({
             'results': results,
             'total': len(results),
-            'accepted': len([r for r in results if r['status'] == 'ACCEPTED']),
-            'rejected': len([r for r in results if r['status'] == 'REJECTED']),
-            'errors': len([r for r in results if r['status'] == 'ERROR'])
-        })
+            'accepted': counts['ACCEPTED'],
+            'rejected': counts['REJECTED'],
+            'errors': counts['ERROR']
+        }).decode('utf-8')
     }
@@ -3,27 +3,63 @@ Amazon Pinpoint WhatsApp Notification Module
 Sends job application notifications via AWS Pinpoint WhatsApp channel
 """
 
-import json
 import os
 import logging
 from typing import Dict, Any, Optional, Tuple
-import boto3
 from botocore.exceptions import ClientError
 
 logger = logging.getLogger()
 logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO'))
 
-# AWS clients
-pinpoint = boto3.client('pinpoint', region_name=os.environ.get('REGION', 'ap-southeast-5'))
+# AWS clients, created on first send
+pinpoint = None
+
+
+def _pinpoint():
+    """Get the shared Pinpoint client, creating it on first use"""
+    global pinpoint
+    if pinpoint is None:
+        import boto3
+        from botocore.config import Config
+        pinpoint = boto3.client(
+            'pinpoint',
+            region_name=os.environ.get('REGION', 'ap-southeast-5'),
+            config=Config(
+                tcp_keepalive=True,  # Reuse the connection across warm invocations
+                connect_timeout=2,
+                read_timeout=10,
+                retries={'max_attempts': 3, 'mode': 'standard'}
+            )
+        )
+    return pinpoint
+
 
 # Pinpoint configuration (from environment variables)
 PINPOINT_APP_ID = os.environ.get('PINPOINT_APP_ID', '')
 PINPOINT_ORIGINATION_NUMBER = os.environ.get('PINPOINT_ORIGINATION_NUMBER', '')
 PINPOINT_RECIPIENT_NUMBER = os.environ.get('PINPOINT_RECIPIENT_NUMBER', '')
 
+# Configuration is fixed for the life of the container, so check it once
+PINPOINT_ENABLED = bool(PINPOINT_APP_ID and PINPOINT_ORIGINATION_NUMBER and PINPOINT_RECIPIENT_NUMBER)
+if not PINPOINT_APP_ID:
+    logger.warning("PINPOINT_APP_ID not configured")
+if not PINPOINT_ORIGINATION_NUMBER:
+    logger.warning("PINPOINT_ORIGINATION_NUMBER not configured")
+if not PINPOINT_RECIPIENT_NUMBER:
+    logger.warning("PINPOINT_RECIPIENT_NUMBER not configured")
+
+# SMSMessage fields shared by every send
+SMS_MESSAGE_DEFAULTS = {
+    'MessageType': 'TRANSACTIONAL',  # TRANSACTIONAL or PROMOTIONAL
+    'OriginationNumber': PINPOINT_ORIGINATION_NUMBER
+}
+
 # Message template names (must be pre-approved in Pinpoint)
 TEMPLATE_JOB_APPLICATION = 'job_application_notification'
 
+# Fixed opening of the plain-text notification
+MESSAGE_HEADER = "🔔 New Job Application\n\n"
+
 
 def is_pinpoint_enabled() -> bool:
     """
@@ -32,16 +68,7 @@ def is_pinpoint_enabled() -> bool:
     Returns:
         True if all required config is present, False otherwise
     """
-    if not PINPOINT_APP_ID:
-        logger.warning("PINPOINT_APP_ID not configured")
-        return False
-    if not PINPOINT_ORIGINATION_NUMBER:
-        logger.warning("PINPOINT_ORIGINATION_NUMBER not configured")
-        return False
-    if not PINPOINT_RECIPIENT_NUMBER:
-        logger.warning("PINPOINT_RECIPIENT_NUMBER not configured")
-        return False
-    return True
+    return PINPOINT_ENABLED
 
 
 def format_application_message(submission: Dict[str, Any]) -> str:
@@ -58,48 +85,49 @@ def format_application_message(submission: Dict[str, Any]) -> str:
     recruiter = submission.get('recruiter', {})
     job = submission.get('job', {})
 
-    # Build message sections
-    lines = [
-        "🔔 New Job Application",
-        "",
-        f"👤 {recruiter.get('name', 'N/A')}",
-        f"📧 {recruiter.get('email', 'N/A')}",
-    ]
-
-    if recruiter.get('phone'):
-        lines.append(f"📞 {recruiter.get('phone')}")
-
-    if recruiter.get('agency'):
-        lines.append(f"🏢 {recruiter.get('agency')}")
-
-    lines.extend([
-        "",
-        f"💼 {job.get('title', 'N/A')} at {job.get('company', 'N/A')}",
-    ])
-
     # Salary range
     salary_min = job.get('salary_min', 0)
     salary_max = job.get('salary_max', 0)
     currency = job.get('currency', 'MYR')
 
     if salary_min > 0 and salary_max > 0:
-        lines.append(f"💰 {currency} {salary_min:,} - {salary_max:,}")
+        salary_line = f"\n💰 {currency} {salary_min:,} - {salary_max:,}"
     elif salary_min > 0:
-        lines.append(f"💰 {currency} {salary_min:,}+")
+        salary_line = f"\n💰 {currency} {salary_min:,}+"
+    else:
+        salary_line = ''
 
     # Skills
-    skills = job.get('skills', [])
-    if skills:
-        skills_str = ', '.join(skills[:5])  # Limit to 5 for SMS-style messages
-        if len(skills) > 5:
-            skills_str += f" +{len(skills) - 5} more"
-        lines.append(f"🔧 {skills_str}")
-
-    # Submission metadata
-    submission_id = submission.get('submission_id', 'Unknown')
-    lines.append(f"\n📋 {submission_id}")
-
-    return '\n'.join(lines)
+    skills = job.get('skills') or []
+    skill_count = len(skills)
+    if not skill_count:
+        skills_line = ''
+    elif skill_count > 5:  # Limit to 5 for SMS-style messages
+        skills_line = f"\n🔧 {', '.join(skills[:5])} +{skill_count - 5} more"
+    else:
+        skills_line = f"\n🔧 {', '.join(skills)}"
+
+    # Optional lines are emitted only when the field is set
+    phone = recruiter.get('phone')
+    agency = recruiter.get('agency')
+    return ''.join((
+        MESSAGE_HEADER,
+        f"👤 {recruiter.get('name', 'N/A')}\n📧 {recruiter.get('email', 'N/A')}",
+        f"\n📞 {phone}" if phone else '',
+        f"\n🏢 {agency}" if agency else '',
+        f"\n\n💼 {job.get('title', 'N/A')} at {job.get('company', 'N/A')}",
+        salary_line,
+        skills_line,
+        f"\n\n📋 {submission.get('submission_id', 'Unknown')}"
+    ))
+
+
+def _recipient_result(response: Dict[str, Any], recipient: str) -> Dict[str, Any]:
+    """Get one address's entry from a send_messages response ({} if it is missing)"""
+    try:
+        return response['MessageResponse']['Result'][recipient]
+    except KeyError:
+        return {}
 
 
 def send_whatsapp_message(
@@ -127,11 +155,7 @@ def send_whatsapp_message(
                 }
             },
             'MessageConfiguration': {
-                'SMSMessage': {
-                    'Body': message_text,
-                    'MessageType': 'TRANSACTIONAL',  # TRANSACTIONAL or PROMOTIONAL
-                    'OriginationNumber': PINPOINT_ORIGINATION_NUMBER
-                }
+                'SMSMessage': {**SMS_MESSAGE_DEFAULTS, 'Body': message_text}
             }
         }
 
@@ -142,14 +166,13 @@ def send_whatsapp_message(
             }
 
         # Send message
-        response = pinpoint.send_messages(
+        response = _pinpoint().send_messages(
             ApplicationId=PINPOINT_APP_ID,
             MessageRequest=message_request
         )
 
         # Parse response
-        result = response.get('MessageResponse', {}).get('Result', {})
-        recipient_result = result.get(recipient, {})
+        recipient_result = _recipient_result(response, recipient)
 
         delivery_status = recipient_result.get('DeliveryStatus')
         message_id = recipient_result.get('MessageId', '')
@@ -244,11 +267,7 @@ def send_template_message(
                 }
             },
             'MessageConfiguration': {
-                'SMSMessage': {
-                    'MessageType': 'TRANSACTIONAL',
-                    'OriginationNumber': PINPOINT_ORIGINATION_NUMBER,
-                    'TemplateId': template_name
-                }
+                'SMSMessage': {**SMS_MESSAGE_DEFAULTS, 'TemplateId': template_name}
             }
         }
 
@@ -256,14 +275,13 @@ def send_template_message(
             message_request['Context'] = {'submission_id': submission_id}
 
         # Send message
-        response = pinpoint.send_messages(
+        response = _pinpoint().send_messages(
             ApplicationId=PINPOINT_APP_ID,
             MessageRequest=message_request
         )
 
         # Parse response
-        result = response.get('MessageResponse', {}).get('Result', {})
-        recipient_result = result.get(recipient, {})
+        recipient_result = _recipient_result(response, recipient)
 
         delivery_status = recipient_result.get('DeliveryStatus')
         message_id = recipient_result.get('MessageId', '')